@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, Response, HTTPException
-from backend.api.database import get_db
-from backend.api.admin.services import get_admin
+from fastapi import APIRouter, Depends, Request, Response, HTTPException
+from backend.api.database import db_pool_stats, engine, get_db, get_read_db, replica_engine
+from backend.api.admin.services import get_admin, participant_export_fields, stream_participants, stream_teams, team_export_fields
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.admin.schemas import AdminLogin
-from backend.api.admin.utils import create_admin_access_token, verify_password
+from backend.api.admin.utils import ExportFormat, PasswordHasherBusy, create_admin_access_token, export_response, verify_password_async
+from backend.api.redis.redis_service import admin_login_throttled, record_failed_admin_login, reset_failed_admin_logins
+from backend.api.admin.models import Admin
+from backend.api.depends import get_client_ip, get_current_admin, token_cache
+from backend.api.redis.cache import cache_stats
+from backend.api.redis.redis_client import redis_pool_stats
 
 router = APIRouter(prefix='/admin', tags=['admin'])
 
@@ -11,14 +16,27 @@ router = APIRouter(prefix='/admin', tags=['admin'])
 @router.post("/login")
 async def admin_login(
     data: AdminLogin,
+    request: Request,
     response: Response,
     session: AsyncSession = Depends(get_db),
 ):
+    ip = get_client_ip(request)
+    if await admin_login_throttled(email=data.email, ip=ip):
+        raise HTTPException(status_code=429, detail="Too many login attempts, try again later")
+
     admin = await get_admin(session=session, email=data.email)
 
-    if not admin or not verify_password(data.password, admin.password_hash):
+    try:
+        verified = admin is not None and await verify_password_async(data.password, admin.password_hash)
+    except PasswordHasherBusy:
+        raise HTTPException(status_code=429, detail="Too many login attempts, try again later")
+
+    if not verified:
+        await record_failed_admin_login(email=data.email, ip=ip)
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    await reset_failed_admin_logins(email=data.email, ip=ip)
+
     token = create_admin_access_token({"sub": str(admin.id)})
     response.set_cookie(
         key="admin_access_token",
@@ -32,6 +50,49 @@ async def admin_login(
     return {"message": "Logged in"}
 
 
+@router.get("/metrics")
+async def metrics(
+    admin: Admin = Depends(get_current_admin),
+):
+    return {
+        "cache": cache_stats,
+        "jwt_cache": token_cache.stats(),
+        "redis_pool": redis_pool_stats(),
+        "db_pool": db_pool_stats(engine),
+        "db_replica_pool": db_pool_stats(replica_engine) if replica_engine else None,
+    }
+
+
+@router.get("/export/participants")
+async def export_participants(
+    format: ExportFormat = "ndjson",
+    include_teams: bool = False,
+    session: AsyncSession = Depends(get_read_db),
+    admin: Admin = Depends(get_current_admin),
+):
+    return export_response(
+        stream_participants(session=session, include_teams=include_teams),
+        participant_export_fields(include_teams),
+        format,
+        "participants",
+    )
+
+
+@router.get("/export/teams")
+async def export_teams(
+    format: ExportFormat = "ndjson",
+    include_members: bool = False,
+    session: AsyncSession = Depends(get_read_db),
+    admin: Admin = Depends(get_current_admin),
+):
+    return export_response(
+        stream_teams(session=session, include_members=include_members),
+        team_export_fields(include_members),
+        format,
+        "teams",
+    )
+
+
 @router.post("/logout")
 async def logout(response: Response):
     response.delete_cookie("admin_access_token")
@@ -1,6 +1,29 @@
+import logging
+from typing import AsyncIterator
+
 from backend.api.admin.models import Admin
+from backend.api.config import settings
+from backend.api.models import User
+from backend.api.profile.utils import get_avatar_url, parse_tags
+from backend.api.redis.redis_client import redis_client
+from backend.api.teams.models import Team, TeamMember
+from redis.exceptions import RedisError
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+
+
+logger = logging.getLogger(__name__)
+
+
+def admin_principal_key(admin_id: int) -> str:
+    return f"admin:principal:{admin_id}"
+
+async def invalidate_admin_principal(admin_id: int) -> None:
+    try:
+        await redis_client.delete(admin_principal_key(admin_id))
+    except RedisError:
+        logger.warning("Failed to invalidate cached admin %s", admin_id, exc_info=True)
 
 async def get_admin(session: AsyncSession, email: str) -> Admin:
     result = await session.execute(select(Admin).where(Admin.email == email))
@@ -8,6 +31,28 @@ async def get_admin(session: AsyncSession, email: str) -> Admin:
 
     return admin
 
+async def get_admin_principal(session: AsyncSession, admin_id: int) -> Admin | None:
+    key = admin_principal_key(admin_id)
+    try:
+        email = await redis_client.get(key)
+    except RedisError:
+        email = None
+        logger.warning("Failed to read cached admin %s", admin_id, exc_info=True)
+
+    if email is not None:
+        return Admin(id=admin_id, email=email)
+
+    admin = await session.get(Admin, admin_id)
+    if admin is None:
+        return None
+
+    try:
+        await redis_client.setex(key, settings.admin_cache_ttl, admin.email)
+    except RedisError:
+        logger.warning("Failed to cache admin %s", admin_id, exc_info=True)
+
+    return admin
+
 async def create_admin(session: AsyncSession, email: str, password_hash: str):
     new_admin = Admin(
         email=email,
@@ -16,4 +61,109 @@ async def create_admin(session: AsyncSession, email: str, password_hash: str):
     session.add(new_admin)
 
     await session.commit()
-    await session.refresh(new_admin)
+    await invalidate_admin_principal(new_admin.id)
+
+async def delete_admin(session: AsyncSession, admin: Admin) -> None:
+    admin_id = admin.id
+    await session.delete(admin)
+    await session.commit()
+    await invalidate_admin_principal(admin_id)
+
+
+PARTICIPANT_EXPORT_FIELDS = ("telegram_id", "username", "fullname", "role", "description", "tags", "pic", "registered_at")
+PARTICIPANT_TEAM_FIELDS = ("team_ids", "team_titles")
+TEAM_EXPORT_FIELDS = ("team_id", "title", "description", "captain_id")
+TEAM_MEMBER_FIELDS = ("member_count", "member_ids")
+
+def participant_export_fields(include_teams: bool) -> tuple[str, ...]:
+    return PARTICIPANT_EXPORT_FIELDS + (PARTICIPANT_TEAM_FIELDS if include_teams else ())
+
+def team_export_fields(include_members: bool) -> tuple[str, ...]:
+    return TEAM_EXPORT_FIELDS + (TEAM_MEMBER_FIELDS if include_members else ())
+
+async def stream_rows(session: AsyncSession, statement) -> AsyncIterator[list]:
+    result = await session.stream(statement.execution_options(yield_per=settings.export_batch_size))
+    async for rows in result.partitions():
+        yield rows
+
+async def stream_participants(session: AsyncSession, include_teams: bool) -> AsyncIterator[list[dict]]:
+    statement = select(
+        User.telegram_id,
+        User.username,
+        User.fullname,
+        User.role,
+        User.description,
+        User.tags,
+        User.avatar_hash,
+        User.date_registration,
+    ).order_by(User.id)
+
+    if include_teams:
+        memberships = (
+            select(
+                TeamMember.telegram_id,
+                func.array_agg(aggregate_order_by(Team.team_id, TeamMember.joined_at)).label("team_ids"),
+                func.array_agg(aggregate_order_by(func.coalesce(Team.title, ""), TeamMember.joined_at)).label("team_titles"),
+            )
+            .join(Team, Team.team_id == TeamMember.team_id)
+            .group_by(TeamMember.telegram_id)
+            .subquery()
+        )
+        statement = (
+            statement
+            .add_columns(memberships.c.team_ids, memberships.c.team_titles)
+            .outerjoin(memberships, memberships.c.telegram_id == User.telegram_id)
+        )
+
+    async for rows in stream_rows(session, statement):
+        batch = []
+        for row in rows:
+            item = {
+                "telegram_id": row.telegram_id,
+                "username": row.username or "",
+                "fullname": row.fullname or "",
+                "role": row.role,
+                "description": row.description or "",
+                "tags": parse_tags(row.tags),
+                "pic": get_avatar_url(row.telegram_id, row.avatar_hash, "medium"),
+                "registered_at": row.date_registration,
+            }
+            if include_teams:
+                item["team_ids"] = row.team_ids or []
+                item["team_titles"] = row.team_titles or []
+            batch.append(item)
+        yield batch
+
+async def stream_teams(session: AsyncSession, include_members: bool) -> AsyncIterator[list[dict]]:
+    statement = select(Team.team_id, Team.title, Team.description, Team.captain_id).order_by(Team.team_id)
+
+    if include_members:
+        members = (
+            select(
+                TeamMember.team_id,
+                func.count().label("member_count"),
+                func.array_agg(aggregate_order_by(TeamMember.telegram_id, TeamMember.joined_at)).label("member_ids"),
+            )
+            .group_by(TeamMember.team_id)
+            .subquery()
+        )
+        statement = (
+            statement
+            .add_columns(members.c.member_count, members.c.member_ids)
+            .outerjoin(members, members.c.team_id == Team.team_id)
+        )
+
+    async for rows in stream_rows(session, statement):
+        batch = []
+        for row in rows:
+            item = {
+                "team_id": row.team_id,
+                "title": row.title or "",
+                "description": row.description or "",
+                "captain_id": row.captain_id,
+            }
+            if include_members:
+                item["member_count"] = row.member_count or 0
+                item["member_ids"] = row.member_ids or []
+            batch.append(item)
+        yield batch
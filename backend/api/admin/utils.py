@@ -1,5 +1,12 @@
+import asyncio
+import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import AsyncIterator, Literal
 import jwt
+import orjson
+from fastapi.responses import StreamingResponse
 from backend.api.config import settings
 from passlib.context import CryptContext
 
@@ -13,7 +20,73 @@ def create_admin_access_token(data: dict):
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
+password_slots = asyncio.Semaphore(settings.password_hash_max_pending)
+
+
+class PasswordHasherBusy(Exception):
+    pass
+
+
 def verify_password(plain, hashed):
     return pwd_context.verify(plain, hashed)
 def hash_password(password):
     return pwd_context.hash(password)
+async def run_password_task(fn, *args):
+    if password_slots.locked():
+        raise PasswordHasherBusy()
+    async with password_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_executor, fn, *args)
+async def verify_password_async(plain, hashed):
+    return await run_password_task(verify_password, plain, hashed)
+async def hash_password_async(password):
+    return await run_password_task(hash_password, password)
+
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def ndjson_lines(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        if rows:
+            yield b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def csv_cell(value):
+    if isinstance(value, list):
+        return "; ".join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def csv_lines(batches: AsyncIterator[list[dict]], fields: tuple[str, ...]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue().encode()
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([csv_cell(row[field]) for field in fields] for row in rows)
+        yield buffer.getvalue().encode()
+
+
+def export_response(batches: AsyncIterator[list[dict]], fields: tuple[str, ...], format: ExportFormat, name: str) -> StreamingResponse:
+    content = ndjson_lines(batches) if format == "ndjson" else csv_lines(batches, fields)
+    filename = f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,47 @@
+import argparse
+import base64
+import binascii
+import os
+
+from backend.api.benchmarks.timing import measure, report
+from backend.api.images import decode_base64_image, encode_base64_image
+
+
+def legacy_decode_pic_base64(pic_str: str | None) -> bytes | None:
+    if not pic_str or not pic_str.strip():
+        return None
+    try:
+        pic_cleaned = pic_str.strip()
+        if ',' in pic_cleaned:
+            pic_cleaned = pic_cleaned.split(',')[-1]
+        valid_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')
+        if not all(c in valid_chars for c in pic_cleaned):
+            return None
+        missing_padding = len(pic_cleaned) % 4
+        if missing_padding:
+            pic_cleaned += '=' * (4 - missing_padding)
+        return base64.b64decode(pic_cleaned, validate=True)
+    except (ValueError, TypeError, binascii.Error):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the legacy base64 image decoder with decode_base64_image")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 5, 10], help="decoded sizes in MB")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        data = os.urandom(size * 1024 * 1024)
+        value = encode_base64_image(data, "image/jpeg")
+        max_size = len(data)
+
+        assert legacy_decode_pic_base64(value) == data
+        assert decode_base64_image(value, max_size=max_size) == data
+
+        report(f"legacy {size}MB", measure(lambda: legacy_decode_pic_base64(value), args.repeat))
+        report(f"decode_base64_image {size}MB", measure(lambda: decode_base64_image(value, max_size=max_size), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
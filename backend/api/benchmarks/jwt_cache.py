@@ -0,0 +1,47 @@
+import argparse
+import random
+import time
+
+import jwt
+
+from backend.api.benchmarks.timing import measure, report
+from backend.api.config import settings
+from backend.api.depends import get_current_telegram_id, get_optional_telegram_id, token_cache
+
+
+def issue_tokens(count: int) -> list[str]:
+    expires_at = int(time.time()) + 3600
+    return [
+        jwt.encode({"telegram_id": str(100000 + i), "exp": expires_at}, settings.secret_key, algorithm=settings.algorithm)
+        for i in range(count)
+    ]
+
+
+def uncached_request(token: str) -> None:
+    jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+
+
+def cached_request(token: str) -> None:
+    get_current_telegram_id(access_token=token)
+    get_optional_telegram_id(access_token=token)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-request JWT auth overhead with and without the claims cache")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args()
+
+    tokens = issue_tokens(args.users)
+    rng = random.Random(0)
+    workload = iter([rng.choice(tokens) for _ in range(args.requests)] * 2)
+
+    token_cache.clear()
+    report("jwt.decode per request", measure(lambda: uncached_request(next(workload)), args.requests))
+    report("cached decode per request", measure(lambda: cached_request(next(workload)), args.requests))
+    print(f"cache: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import random
+
+from sqlalchemy import delete, insert, text
+
+from backend.api.benchmarks.timing import measure_async, report
+from backend.api.database import async_session, engine
+from backend.api.models import User
+from backend.api.profile.service import search_users
+
+
+PREFIX = "bench-"
+TAGS = ["python", "go", "rust", "java", "ml", "frontend", "backend", "design", "devops", "mobile", "data", "security"]
+ROLES = ["developer", "designer", "analyst", "manager", "mentor"]
+WORDS = [
+    "react", "kubernetes", "postgres", "fastapi", "pytorch", "figma", "docker", "android", "swift", "kafka",
+    "graphql", "pandas", "linux", "terraform", "vue", "django", "spark", "redis", "nginx", "typescript",
+    "hackathon", "startup", "student", "product", "research", "backend", "frontend", "mobile", "cloud", "security",
+]
+
+CASES = {
+    "tags": {"tags": ["rust"]},
+    "tags + role": {"tags": ["ml", "python"], "role": "mentor"},
+    "text": {"query": "kubernetes"},
+    "text + tags": {"query": "react typescript", "tags": ["frontend"]},
+    "text + role": {"query": "pytorch research", "role": "analyst"},
+}
+
+
+def synthetic_user(index: int, rng: random.Random) -> dict:
+    return {
+        "telegram_id": f"{PREFIX}{index}",
+        "fullname": f"Bench User {index}",
+        "description": " ".join(rng.sample(WORDS, 8)),
+        "role": rng.choice(ROLES),
+        "tags": rng.sample(TAGS, rng.randint(1, 3)),
+    }
+
+
+async def cleanup() -> None:
+    async with async_session() as session:
+        await session.execute(delete(User).where(User.telegram_id.startswith(PREFIX)))
+        await session.commit()
+
+
+async def seed(count: int, batch_size: int) -> None:
+    rng = random.Random(0)
+    async with async_session() as session:
+        for start in range(0, count, batch_size):
+            users = [synthetic_user(index, rng) for index in range(start, min(count, start + batch_size))]
+            await session.execute(insert(User), users)
+        await session.commit()
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE users"))
+
+
+async def run(users: int, queries: int, limit: int, keep: bool) -> None:
+    await cleanup()
+    print(f"Seeding {users} synthetic users...")
+    await seed(users, batch_size=5000)
+
+    try:
+        async with async_session() as session:
+            for name, filters in CASES.items():
+                samples = await measure_async(lambda: search_users(session=session, limit=limit, **filters), queries)
+                report(name, samples)
+    finally:
+        if not keep:
+            await cleanup()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /participants/search queries on synthetic users in DATABASE_URL")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the synthetic users after the run")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.users, args.queries, args.limit, args.keep))
+
+
+if __name__ == "__main__":
+    main()
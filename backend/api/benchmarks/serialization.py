@@ -0,0 +1,113 @@
+import argparse
+import asyncio
+import datetime
+import time
+from types import SimpleNamespace
+
+import httpx
+from fastapi import FastAPI
+
+from backend.api.hackathons.schemas import HackInfo
+from backend.api.hackathons.utils import build_hack_info, hack_info_row
+from backend.api.pagination import page_response
+from backend.api.profile.schemas import UserInfo
+from backend.api.profile.utils import build_user_info, user_info_row
+from backend.api.teams.schemas import ShortTeamInfo
+from backend.api.teams.service import short_team_info_row
+
+
+def synthetic_rows(count: int) -> dict[str, list]:
+    return {
+        "users": [
+            SimpleNamespace(
+                telegram_id=str(100000 + i),
+                fullname=f"User {i}",
+                description="Backend developer looking for a team " * 3,
+                role="developer",
+                tags=["python", "fastapi", "postgres"],
+                avatar_hash=f"{i:064x}",
+            )
+            for i in range(count)
+        ],
+        "hackathons": [
+            SimpleNamespace(
+                hack_id=i,
+                title=f"Hackathon {i}",
+                description="Weekend hackathon about developer tools " * 3,
+                pic_hash=f"{i:064x}",
+                event_date=datetime.date(2026, 1, 1) + datetime.timedelta(days=i),
+            )
+            for i in range(count)
+        ],
+        "teams": [
+            SimpleNamespace(team_id=i, title=f"Team {i}", description="We build things " * 3)
+            for i in range(count)
+        ],
+    }
+
+
+def create_app(rows: dict[str, list]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/pydantic/users", response_model=list[UserInfo])
+    async def pydantic_users():
+        return [build_user_info(user) for user in rows["users"]]
+
+    @app.get("/pydantic/hackathons", response_model=list[HackInfo])
+    async def pydantic_hackathons():
+        return [build_hack_info(hack) for hack in rows["hackathons"]]
+
+    @app.get("/pydantic/teams", response_model=list[ShortTeamInfo])
+    async def pydantic_teams():
+        return [
+            ShortTeamInfo(team_id=team.team_id, title=team.title or "", description=team.description or "")
+            for team in rows["teams"]
+        ]
+
+    @app.get("/orjson/users", response_model=list[UserInfo])
+    async def orjson_users():
+        return page_response([user_info_row(user) for user in rows["users"]], None)
+
+    @app.get("/orjson/hackathons", response_model=list[HackInfo])
+    async def orjson_hackathons():
+        return page_response([hack_info_row(hack) for hack in rows["hackathons"]], None)
+
+    @app.get("/orjson/teams", response_model=list[ShortTeamInfo])
+    async def orjson_teams():
+        return page_response([short_team_info_row(team) for team in rows["teams"]], None)
+
+    return app
+
+
+async def throughput(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return requests / (time.perf_counter() - started)
+
+
+async def run(rows: int, requests: int) -> None:
+    app = create_app(synthetic_rows(rows))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for listing in ("users", "hackathons", "teams"):
+            legacy = await client.get(f"/pydantic/{listing}")
+            fast = await client.get(f"/orjson/{listing}")
+            assert legacy.json() == fast.json()
+
+            before = await throughput(client, f"/pydantic/{listing}", requests)
+            after = await throughput(client, f"/orjson/{listing}", requests)
+            print(f"{listing:<12} pydantic {before:8.1f} req/s   orjson {after:8.1f} req/s   x{after / before:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare list endpoint throughput of pydantic models and orjson rows")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.requests))
+
+
+if __name__ == "__main__":
+    main()
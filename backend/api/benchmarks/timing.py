@@ -0,0 +1,34 @@
+import time
+from typing import Awaitable, Callable
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(name: str, samples: list[float]) -> None:
+    print(
+        f"{name:<32} n={len(samples):<6} "
+        f"p50={percentile(samples, 0.5) * 1000:8.3f}ms "
+        f"p95={percentile(samples, 0.95) * 1000:8.3f}ms "
+        f"max={max(samples) * 1000:8.3f}ms"
+    )
+
+
+def measure(fn: Callable[[], object], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def measure_async(fn: Callable[[], Awaitable[object]], repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return samples
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, Integer, TEXT
+from sqlalchemy.sql import func
+from backend.api.database import Base
+
+
+class Blob(Base):
+    __tablename__ = 'blobs'
+
+    hash = Column(TEXT, primary_key=True)
+    content_type = Column(TEXT, nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,89 @@
+import hashlib
+from dataclasses import dataclass
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.blobs.models import Blob
+from backend.api.blobs.storage import blob_store
+from backend.api.image_pipeline import ProcessedImage, ProcessedImageFile
+from backend.api.images import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, etag_matches, sniff_image_type
+
+
+@dataclass
+class StoredImage:
+    original_hash: str
+    thumb_hash: str
+    medium_hash: str
+
+
+def blob_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+async def register_blob(session: AsyncSession, digest: str, content_type: str, size: int) -> bool:
+    result = await session.execute(
+        insert(Blob)
+        .values(hash=digest, content_type=content_type, size=size)
+        .on_conflict_do_nothing()
+        .returning(Blob.hash)
+    )
+    return result.scalar() is not None or not await blob_store.exists(digest)
+
+
+async def store_blob(session: AsyncSession, data: bytes, content_type: str | None = None) -> str:
+    digest = blob_hash(data)
+
+    if await register_blob(session, digest, content_type or sniff_image_type(data), len(data)):
+        await blob_store.put(digest, data)
+
+    return digest
+
+
+async def store_blob_file(session: AsyncSession, path: str, digest: str, content_type: str, size: int) -> str:
+    if await register_blob(session, digest, content_type, size):
+        await blob_store.put_file(digest, path)
+
+    return digest
+
+
+async def store_image(session: AsyncSession, processed: ProcessedImage) -> StoredImage:
+    return StoredImage(
+        original_hash=await store_blob(session, processed.original),
+        thumb_hash=await store_blob(session, processed.thumb, "image/webp"),
+        medium_hash=await store_blob(session, processed.medium, "image/webp"),
+    )
+
+
+async def store_image_file(session: AsyncSession, processed: ProcessedImageFile) -> StoredImage:
+    return StoredImage(
+        original_hash=await store_blob_file(
+            session,
+            processed.original_path,
+            processed.original_hash,
+            processed.content_type,
+            processed.original_size,
+        ),
+        thumb_hash=await store_blob(session, processed.thumb, "image/webp"),
+        medium_hash=await store_blob(session, processed.medium, "image/webp"),
+    )
+
+
+async def get_blob(session: AsyncSession, digest: str) -> Blob | None:
+    result = await session.execute(select(Blob).where(Blob.hash == digest))
+    return result.scalars().first()
+
+
+async def blob_response(request: Request, blob: Blob, version: str | None = None) -> Response:
+    version = version or blob.hash
+    headers = {
+        "ETag": f'"{blob.hash}"',
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if request.query_params.get("v") == version else REVALIDATE_CACHE_CONTROL,
+    }
+
+    if etag_matches(request.headers.get("if-none-match"), blob.hash):
+        return Response(status_code=304, headers=headers)
+
+    return await blob_store.response(blob.hash, blob.content_type, headers)
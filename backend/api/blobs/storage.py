@@ -0,0 +1,151 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Callable
+
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+from backend.api.config import settings
+
+
+class BlobNotFound(Exception):
+    pass
+
+
+class BlobStore(ABC):
+    @abstractmethod
+    async def exists(self, blob_hash: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def put(self, blob_hash: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    async def put_file(self, blob_hash: str, path: str) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, blob_hash: str) -> bytes:
+        ...
+
+    async def response(self, blob_hash: str, content_type: str, headers: dict[str, str]) -> Response:
+        return Response(content=await self.get(blob_hash), media_type=content_type, headers=headers)
+
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def path(self, blob_hash: str) -> Path:
+        return self.root / blob_hash[:2] / blob_hash[2:4] / blob_hash
+
+    async def exists(self, blob_hash: str) -> bool:
+        return await asyncio.to_thread(self.path(blob_hash).is_file)
+
+    def _write(self, blob_hash: str, write: Callable[[BinaryIO], object]) -> None:
+        path = self.path(blob_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                write(tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _copy_file(self, blob_hash: str, source_path: str) -> None:
+        with open(source_path, "rb") as source:
+            self._write(blob_hash, lambda tmp_file: shutil.copyfileobj(source, tmp_file))
+
+    async def put(self, blob_hash: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, blob_hash, lambda tmp_file: tmp_file.write(data))
+
+    async def put_file(self, blob_hash: str, path: str) -> None:
+        await asyncio.to_thread(self._copy_file, blob_hash, path)
+
+    async def get(self, blob_hash: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self.path(blob_hash).read_bytes)
+        except FileNotFoundError as e:
+            raise BlobNotFound(blob_hash) from e
+
+    async def response(self, blob_hash: str, content_type: str, headers: dict[str, str]) -> Response:
+        path = self.path(blob_hash)
+        if not await asyncio.to_thread(path.is_file):
+            raise BlobNotFound(blob_hash)
+        return FileResponse(path, media_type=content_type, headers=headers)
+
+
+class S3BlobStore(BlobStore):
+    def __init__(self, bucket: str, endpoint_url: str | None = None, region: str | None = None,
+                 access_key_id: str | None = None, secret_access_key: str | None = None, prefix: str = ""):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError as e:
+            raise RuntimeError("boto3 is required for the s3 blob backend") from e
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client_error = ClientError
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+        )
+
+    def key(self, blob_hash: str) -> str:
+        return f"{self.prefix}{blob_hash}"
+
+    def is_missing(self, error) -> bool:
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    async def exists(self, blob_hash: str) -> bool:
+        try:
+            await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=self.key(blob_hash))
+        except self.client_error as e:
+            if self.is_missing(e):
+                return False
+            raise
+        return True
+
+    async def put(self, blob_hash: str, data: bytes) -> None:
+        await asyncio.to_thread(self.client.put_object, Bucket=self.bucket, Key=self.key(blob_hash), Body=data)
+
+    async def put_file(self, blob_hash: str, path: str) -> None:
+        await asyncio.to_thread(self.client.upload_file, path, self.bucket, self.key(blob_hash))
+
+    async def get(self, blob_hash: str) -> bytes:
+        try:
+            response = await asyncio.to_thread(self.client.get_object, Bucket=self.bucket, Key=self.key(blob_hash))
+        except self.client_error as e:
+            if self.is_missing(e):
+                raise BlobNotFound(blob_hash) from e
+            raise
+        return await asyncio.to_thread(response["Body"].read)
+
+
+def create_blob_store() -> BlobStore:
+    if settings.blob_backend == "local":
+        return LocalBlobStore(settings.blob_local_path)
+    if settings.blob_backend == "s3":
+        return S3BlobStore(
+            bucket=settings.s3_bucket,
+            endpoint_url=settings.s3_endpoint_url,
+            region=settings.s3_region,
+            access_key_id=settings.s3_access_key_id,
+            secret_access_key=settings.s3_secret_access_key,
+            prefix=settings.s3_prefix,
+        )
+    raise ValueError(f"Unknown blob backend: {settings.blob_backend}")
+
+
+blob_store = create_blob_store()
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+
+import aiohttp
+from aiogram import Bot
+from aiogram.exceptions import TelegramNetworkError, TelegramRetryAfter, TelegramServerError
+from aiogram.types import PhotoSize
+
+from backend.api.bot.services import get_stale_avatar_telegram_ids, get_user_by_telegram_id, mark_avatar_synced, update_user_avatar
+from backend.api.config import settings
+from backend.api.database import async_session
+from backend.api.images import ImageTooLarge, InvalidImage
+from backend.api.redis.redis_service import acquire_avatar_refresh_lock
+
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, TelegramNetworkError, TelegramServerError)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class AvatarSync:
+    def __init__(self, bot: Bot):
+        self.bot = bot
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=settings.avatar_queue_size)
+        self.pending: set[str] = set()
+        self.http: aiohttp.ClientSession | None = None
+        self.tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self.http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=settings.avatar_workers),
+            timeout=aiohttp.ClientTimeout(total=settings.avatar_download_timeout),
+            raise_for_status=True,
+        )
+        self.tasks = [asyncio.create_task(self.worker()) for _ in range(settings.avatar_workers)]
+        self.tasks.append(asyncio.create_task(self.refresh_stale()))
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+        if self.http is not None:
+            await self.http.close()
+            self.http = None
+
+    def enqueue(self, telegram_id: str) -> bool:
+        if telegram_id in self.pending:
+            return True
+        try:
+            self.queue.put_nowait(telegram_id)
+        except asyncio.QueueFull:
+            logger.warning("Avatar queue is full, skipping sync for user %s", telegram_id)
+            return False
+        self.pending.add(telegram_id)
+        return True
+
+    async def worker(self) -> None:
+        while True:
+            telegram_id = await self.queue.get()
+            try:
+                await self.sync_with_retry(telegram_id)
+            except Exception:
+                logger.exception("Avatar sync failed for user %s", telegram_id)
+            finally:
+                self.pending.discard(telegram_id)
+                self.queue.task_done()
+
+    async def sync_with_retry(self, telegram_id: str) -> None:
+        attempts = settings.avatar_retry_attempts
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.sync(telegram_id)
+                return
+            except TelegramRetryAfter as e:
+                if attempt == attempts:
+                    raise
+                delay = e.retry_after
+            except RETRYABLE_ERRORS:
+                if attempt == attempts:
+                    raise
+                delay = settings.avatar_retry_backoff * 2 ** (attempt - 1) * random.uniform(1, 2)
+            await asyncio.sleep(delay)
+
+    async def sync(self, telegram_id: str) -> None:
+        photos = await self.bot.get_user_profile_photos(int(telegram_id), limit=1)
+        photo = photos.photos[0][-1] if photos.photos else None
+
+        async with async_session() as session:
+            user = await get_user_by_telegram_id(session=session, telegram_id=telegram_id)
+            if user is None:
+                return
+            if photo is None or photo.file_unique_id == user.avatar_file_unique_id:
+                await mark_avatar_synced(session=session, user=user)
+                return
+
+        try:
+            avatar_bytes = await self.download(photo)
+        except InvalidImage:
+            avatar_bytes = None
+
+        async with async_session() as session:
+            user = await get_user_by_telegram_id(session=session, telegram_id=telegram_id)
+            if user is None:
+                return
+            try:
+                if avatar_bytes is not None:
+                    await update_user_avatar(
+                        session=session,
+                        user=user,
+                        avatar_bytes=avatar_bytes,
+                        file_unique_id=photo.file_unique_id,
+                    )
+                    return
+            except InvalidImage:
+                pass
+
+            logger.warning("Skipping invalid avatar for user %s", telegram_id)
+            await mark_avatar_synced(session=session, user=user, file_unique_id=photo.file_unique_id)
+
+    async def download(self, photo: PhotoSize) -> bytes:
+        if photo.file_size and photo.file_size > settings.max_image_size:
+            raise ImageTooLarge(f"Image is larger than {settings.max_image_size} bytes")
+
+        file = await self.bot.get_file(photo.file_id)
+        url = self.bot.session.api.file_url(self.bot.token, file.file_path)
+        async with self.http.get(url) as response:
+            if response.content_length and response.content_length > settings.max_image_size:
+                raise ImageTooLarge(f"Image is larger than {settings.max_image_size} bytes")
+
+            data = bytearray()
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                data += chunk
+                if len(data) > settings.max_image_size:
+                    raise ImageTooLarge(f"Image is larger than {settings.max_image_size} bytes")
+            return bytes(data)
+
+    async def schedule_stale(self) -> None:
+        if not await acquire_avatar_refresh_lock():
+            return
+
+        async with async_session() as session:
+            telegram_ids = await get_stale_avatar_telegram_ids(
+                session=session,
+                synced_before=datetime.now(timezone.utc) - timedelta(seconds=settings.avatar_max_age),
+                limit=settings.avatar_refresh_batch,
+            )
+
+        for telegram_id in telegram_ids:
+            if telegram_id not in self.pending:
+                self.pending.add(telegram_id)
+                await self.queue.put(telegram_id)
+
+    async def refresh_stale(self) -> None:
+        while True:
+            try:
+                await self.schedule_stale()
+            except Exception:
+                logger.exception("Failed to schedule stale avatar refresh")
+
+            await asyncio.sleep(settings.avatar_refresh_interval)
@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import itertools
+import time
+
+import aiohttp
+
+from backend.api.bot.webhook import SECRET_HEADER
+from backend.api.config import settings
+
+
+update_ids = itertools.count(int(time.time()))
+
+
+def build_update(telegram_id: int, text: str) -> dict:
+    return {
+        "update_id": next(update_ids),
+        "message": {
+            "message_id": next(update_ids),
+            "date": int(time.time()),
+            "chat": {"id": telegram_id, "type": "private", "first_name": "Test"},
+            "from": {"id": telegram_id, "is_bot": False, "first_name": "Test", "username": f"test{telegram_id}"},
+            "text": text,
+            "entities": [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}] if text.startswith("/") else [],
+        },
+    }
+
+
+async def send_updates(url: str, secret: str, count: int, concurrency: int, first_id: int, text: str) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: dict[int, int] = {}
+
+    async with aiohttp.ClientSession() as session:
+        async def send(telegram_id: int) -> None:
+            async with semaphore:
+                async with session.post(url, json=build_update(telegram_id, text), headers={SECRET_HEADER: secret}) as response:
+                    statuses[response.status] = statuses.get(response.status, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(send(first_id + i) for i in range(count)))
+        elapsed = time.perf_counter() - started
+
+    print(f"Sent {count} updates in {elapsed:.2f}s ({count / elapsed:.0f}/s), statuses: {statuses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send fake Telegram updates to a local webhook")
+    parser.add_argument("--url", default=f"http://localhost:{settings.bot_webhook_port}{settings.bot_webhook_path}")
+    parser.add_argument("--secret", default=settings.bot_webhook_secret or "")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--first-id", type=int, default=100000)
+    parser.add_argument("--text", default="/start")
+    args = parser.parse_args()
+
+    asyncio.run(send_updates(args.url, args.secret, args.count, args.concurrency, args.first_id, args.text))
+
+
+if __name__ == "__main__":
+    main()
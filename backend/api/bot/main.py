@@ -1,31 +1,37 @@
 import asyncio
 import logging
 import sys
-from random import choices
 
-import aiohttp
 from aiogram.exceptions import TelegramForbiddenError
 from aiogram import Bot, Dispatcher, types
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.enums import ParseMode
 from aiogram.filters import CommandStart
 from aiogram.types import Message
 
-from backend.api.bot.services import create_user, get_user_by_telegram_id, update_user_avatar
+from backend.api.bot.avatars import AvatarSync
+from backend.api.bot.services import upsert_user
+from backend.api.bot.webhook import run_webhook
 from backend.api.config import settings
 from backend.api.database import async_session
-from backend.api.redis.redis_service import create_login_code
-
-
-def generate_code() -> str:
-    return ''.join(choices('0123456789', k=6))
-
+from backend.api.redis.login_codes import issue_login_code
+from backend.api.redis.redis_client import close_redis_client
 
 
 TOKEN = settings.bot_token
 
-bot = Bot(token=TOKEN, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+bot = Bot(
+    token=TOKEN,
+    session=AiohttpSession(api=TelegramAPIServer.from_base(settings.bot_api_url)) if settings.bot_api_url else None,
+    default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+)
 dp = Dispatcher()
+avatar_sync = AvatarSync(bot)
+dp.startup.register(avatar_sync.start)
+dp.shutdown.register(avatar_sync.stop)
+dp.shutdown.register(close_redis_client)
 
 
 
@@ -38,35 +44,22 @@ async def echo_handler(message: types.Message):
 
 @dp.message(CommandStart())
 async def command_start_handler(message: Message) -> None:
+    telegram_id_str = str(message.from_user.id)
+
     async with async_session() as session:
-        telegram_id_str = str(message.from_user.id)
-        user = await get_user_by_telegram_id(session=session, telegram_id=telegram_id_str)
-        if user is None:
-            user = await create_user(
+        avatar_synced_at, code = await asyncio.gather(
+            upsert_user(
                 session=session,
                 telegram_id=telegram_id_str,
                 username=message.from_user.username,
                 fullname=message.from_user.full_name
-            )
-        
-        if user.avatar is None:
-            user_id = message.from_user.id
-            photos = await bot.get_user_profile_photos(user_id)
-
-            if photos.total_count > 0:
-                avatar = photos.photos[0][-1]
-                file = await bot.get_file(avatar.file_id)
-                
-                file_url = f"https://api.telegram.org/file/bot{TOKEN}/{file.file_path}"
-                async with aiohttp.ClientSession() as http_session:
-                    async with http_session.get(file_url) as response:
-                        avatar_data = await response.read()
-                
-                await update_user_avatar(session=session, user=user, avatar_bytes=avatar_data)
+            ),
+            issue_login_code(telegram_id_str),
+        )
+
+    if avatar_synced_at is None:
+        avatar_sync.enqueue(telegram_id_str)
 
-    telegram_id_str = str(message.from_user.id)
-    code = generate_code()
-    await create_login_code(code, telegram_id_str)
     expire_minutes = settings.auth_code_expire // 60
     await message.answer(f"Ваш код для входа: {code}\nДействителен {expire_minutes} минут.")
 
@@ -79,7 +72,10 @@ async def echo_handler(message: Message) -> None:
         await message.answer("Nice try!")
 
 async def main() -> None:
-    await dp.start_polling(bot)
+    if settings.bot_mode == "webhook":
+        await run_webhook(dp, bot)
+    else:
+        await dp.start_polling(bot)
 
 
 if __name__ == "__main__":
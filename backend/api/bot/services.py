@@ -1,17 +1,27 @@
+from datetime import datetime, timezone
+
 from backend.api.models import User
-from sqlalchemy import select
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from backend.api.redis.cache import invalidate, participant_key
+from backend.api.image_pipeline import process_image_async
+from backend.api.blobs.service import store_image
 
-async def create_user(session: AsyncSession, telegram_id: str, username: str, fullname: str) -> User:
-    new_user = User(
+async def upsert_user(session: AsyncSession, telegram_id: str, username: str | None, fullname: str) -> datetime | None:
+    statement = insert(User).values(
         username=username,
         telegram_id=str(telegram_id),
         fullname=fullname,
     )
-    session.add(new_user)
+    result = await session.execute(
+        statement
+        .on_conflict_do_update(index_elements=[User.telegram_id], set_={"username": statement.excluded.username})
+        .returning(User.avatar_synced_at)
+    )
+    avatar_synced_at = result.scalar_one()
     await session.commit()
-    await session.refresh(new_user)
-    return new_user
+    return avatar_synced_at
 
 async def get_user_by_telegram_id(session: AsyncSession, telegram_id: str) -> User | None:
     result = await session.execute(
@@ -20,7 +30,28 @@ async def get_user_by_telegram_id(session: AsyncSession, telegram_id: str) -> Us
     user = result.scalars().first()
     return user
 
-async def update_user_avatar(session: AsyncSession, user: User, avatar_bytes: bytes) -> None:
-    user.avatar = avatar_bytes
+async def get_stale_avatar_telegram_ids(session: AsyncSession, synced_before: datetime, limit: int) -> list[str]:
+    result = await session.execute(
+        select(User.telegram_id)
+        .where(or_(User.avatar_synced_at.is_(None), User.avatar_synced_at < synced_before))
+        .order_by(User.avatar_synced_at.asc().nulls_first())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+async def mark_avatar_synced(session: AsyncSession, user: User, file_unique_id: str | None = None) -> None:
+    if file_unique_id is not None:
+        user.avatar_file_unique_id = file_unique_id
+    user.avatar_synced_at = datetime.now(timezone.utc)
+    await session.commit()
+
+async def update_user_avatar(session: AsyncSession, user: User, avatar_bytes: bytes, file_unique_id: str | None = None) -> None:
+    processed = await process_image_async(avatar_bytes)
+    stored = await store_image(session, processed)
+    user.avatar_hash = stored.original_hash
+    user.avatar_thumb_hash = stored.thumb_hash
+    user.avatar_medium_hash = stored.medium_hash
+    user.avatar_file_unique_id = file_unique_id
+    user.avatar_synced_at = datetime.now(timezone.utc)
     await session.commit()
-    await session.refresh(user)
+    await invalidate(participant_key(user.telegram_id))
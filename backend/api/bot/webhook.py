@@ -0,0 +1,90 @@
+import asyncio
+import hmac
+import logging
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiohttp import web
+from pydantic import ValidationError
+
+from backend.api.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookHandler:
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, secret: str, concurrency: int):
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.secret = secret.encode()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.tasks: set[asyncio.Task] = set()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if not hmac.compare_digest(request.headers.get(SECRET_HEADER, "").encode(), self.secret):
+            return web.Response(status=401)
+
+        try:
+            update = Update.model_validate(await request.json(), context={"bot": self.bot})
+        except (ValueError, ValidationError):
+            return web.Response(status=400)
+
+        await self.semaphore.acquire()
+        task = asyncio.create_task(self.process(update))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return web.Response()
+
+    async def process(self, update: Update) -> None:
+        try:
+            await self.dispatcher.feed_update(self.bot, update)
+        except Exception:
+            logger.exception("Failed to process update %s", update.update_id)
+        finally:
+            self.semaphore.release()
+
+    async def close(self) -> None:
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+async def health(request: web.Request) -> web.Response:
+    return web.Response(text="ok")
+
+
+def create_app(dispatcher: Dispatcher, bot: Bot) -> tuple[web.Application, WebhookHandler]:
+    if not settings.bot_webhook_secret:
+        raise RuntimeError("BOT_WEBHOOK_SECRET is required in webhook mode")
+
+    handler = WebhookHandler(dispatcher, bot, settings.bot_webhook_secret, settings.bot_webhook_concurrency)
+    app = web.Application()
+    app.router.add_post(settings.bot_webhook_path, handler.handle)
+    app.router.add_get("/healthz", health)
+    return app, handler
+
+
+async def run_webhook(dispatcher: Dispatcher, bot: Bot) -> None:
+    app, handler = create_app(dispatcher, bot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+
+    await dispatcher.emit_startup(bot=bot)
+    try:
+        if settings.bot_webhook_url:
+            await bot.set_webhook(
+                url=settings.bot_webhook_url.rstrip("/") + settings.bot_webhook_path,
+                secret_token=settings.bot_webhook_secret,
+                allowed_updates=dispatcher.resolve_used_update_types(),
+                max_connections=settings.bot_webhook_max_connections,
+            )
+
+        await web.TCPSite(runner, settings.bot_webhook_host, settings.bot_webhook_port).start()
+        logger.info("Listening for webhook updates on %s:%s", settings.bot_webhook_host, settings.bot_webhook_port)
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+        await handler.close()
+        await dispatcher.emit_shutdown(bot=bot)
+        await bot.session.close()
@@ -11,6 +11,12 @@ class Settings(BaseSettings):
     redis_password: Optional[str]
     redis_db: int
     redis_ssl: bool
+    redis_max_connections: int = 50
+    redis_pool_timeout: float = 5.0
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 5.0
+    redis_health_check_interval: int = 30
+    redis_retry_attempts: int = 3
 
     @classmethod
     def validate_redis_password(cls, v):
@@ -26,15 +32,80 @@ class Settings(BaseSettings):
 
     temp_token_expire: int = 3600
     auth_code_expire: int = 300
+    login_code_length: int = 6
+    login_code_issue_retries: int = 5
+    login_code_max_attempts: int = 10
+    login_code_max_code_attempts: int = 3
+    login_code_attempt_window: int = 300
+    team_password_max_attempts: int = 10
+    team_password_max_team_attempts: int = 30
+    team_password_attempt_window: int = 900
 
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 30
+    jwt_cache_size: int = 10000
+    jwt_cache_ttl: int = 300
+    admin_cache_ttl: int = 30
+    admin_login_max_attempts: int = 5
+    admin_login_ip_max_attempts: int = 20
+    admin_login_window: int = 900
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 8
+    trusted_proxies: str = "127.0.0.1/32,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16"
+
+    image_workers: int = 2
+    max_image_size: int = 10 * 1024 * 1024
+    max_image_pixels: int = 40_000_000
+
+    blob_backend: str = "local"
+    blob_local_path: str = str(BASE_DIR / "api" / "data" / "blobs")
+    s3_bucket: Optional[str] = None
+    s3_endpoint_url: Optional[str] = None
+    s3_region: Optional[str] = None
+    s3_access_key_id: Optional[str] = None
+    s3_secret_access_key: Optional[str] = None
+    s3_prefix: str = ""
 
     bot_token: str
+    bot_api_url: Optional[str] = None
+    bot_mode: str = "polling"
+    bot_webhook_url: Optional[str] = None
+    bot_webhook_path: str = "/telegram/webhook"
+    bot_webhook_secret: Optional[str] = None
+    bot_webhook_host: str = "0.0.0.0"
+    bot_webhook_port: int = 8080
+    bot_webhook_concurrency: int = 100
+    bot_webhook_max_connections: int = 40
+    avatar_workers: int = 4
+    avatar_queue_size: int = 1000
+    avatar_download_timeout: int = 30
+    avatar_retry_attempts: int = 3
+    avatar_retry_backoff: float = 1.0
+    avatar_refresh_interval: int = 3600
+    avatar_max_age: int = 7 * 24 * 3600
+    avatar_refresh_batch: int = 200
+
+    max_team_size: Optional[int] = None
+
+    default_page_size: int = 50
+    max_page_size: int = 200
+    export_batch_size: int = 1000
+
+    cache_ttl: int = 60
 
     database_url: Optional[str] = None
+    database_replica_url: Optional[str] = None
+    db_replica_sticky_seconds: int = 10
+    db_replica_retry_after: int = 30
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    db_pgbouncer: bool = False
 
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE),
@@ -2,7 +2,7 @@ import asyncio
 import sys
 import getpass
 from backend.api.database import async_session
-from backend.api.admin.utils import pwd_context
+from backend.api.admin.utils import hash_password_async
 from backend.api.admin.services import create_admin
 
 async def main():
@@ -21,7 +21,7 @@ async def main():
         print("Error: Email and password are required")
         sys.exit(1)
     email = email.encode('utf-8', errors='ignore').decode('utf-8')
-    hashed_password = pwd_context.hash(password)
+    hashed_password = await hash_password_async(password)
     async with async_session() as session:
         await create_admin(session=session, email=email, password_hash=hashed_password)
 
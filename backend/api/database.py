@@ -1,30 +1,94 @@
+import logging
 import os
-from typing import AsyncGenerator
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator
+from uuid import uuid4
+
+from fastapi import Request, Response
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from backend.api.config import settings
+from backend.api.pool_metrics import CheckoutStats
 
 env_database_url = os.getenv("DATABASE_URL") or (settings.database_url or "").strip()
 
 
 DATABASE_URL = env_database_url
 
+READ_PRIMARY_COOKIE = "read_primary"
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    def _do_get(self):
+        with self.checkout_stats.measure(exc.TimeoutError):
+            return super()._do_get()
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+
+def connect_args() -> dict:
+    if settings.db_pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
+
+def create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedPool,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        connect_args=connect_args(),
+    )
+
+
+engine = create_engine(DATABASE_URL)
 
 async_session = async_sessionmaker(
     bind=engine,
-    expire_on_commit=True,
+    expire_on_commit=False,
     class_=AsyncSession,
 )
 
+replica_engine = create_engine(settings.database_replica_url) if settings.database_replica_url else None
+
+async_replica_session = async_sessionmaker(
+    bind=replica_engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+) if replica_engine else None
+
+replica_unhealthy_until = 0.0
+
+
+def db_pool_stats(db_engine: AsyncEngine) -> dict:
+    pool = db_engine.pool
+    return {
+        "max_connections": pool.size() + settings.db_max_overflow,
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        **pool.checkout_stats.as_dict(),
+    }
+
 
 class Base(DeclarativeBase):
     pass
@@ -35,12 +99,45 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def create_all_tables() -> None:
+def mark_primary_reads(response: Response) -> None:
+    response.set_cookie(
+        key=READ_PRIMARY_COOKIE,
+        value="1",
+        max_age=settings.db_replica_sticky_seconds,
+        httponly=True,
+        samesite="lax",
+    )
+
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+async def open_replica_session() -> AsyncSession | None:
+    global replica_unhealthy_until
 
+    if async_replica_session is None or time.monotonic() < replica_unhealthy_until:
+        return None
 
+    session = async_replica_session()
+    try:
+        await session.connection()
+    except (OSError, exc.DBAPIError, exc.TimeoutError):
+        await session.close()
+        replica_unhealthy_until = time.monotonic() + settings.db_replica_retry_after
+        logger.warning("Read replica is unavailable, reading from the primary", exc_info=True)
+        return None
+    return session
 
 
+def reads_primary(request: Request) -> bool:
+    return READ_PRIMARY_COOKIE in request.cookies
 
+
+@asynccontextmanager
+async def read_session(prefer_primary: bool = False) -> AsyncIterator[AsyncSession]:
+    replica = None if prefer_primary else await open_replica_session()
+
+    async with replica or async_session() as session:
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with read_session(reads_primary(request)) as session:
+        yield session
@@ -0,0 +1,29 @@
+import asyncio
+import sys
+from backend.api.database import async_session
+from backend.api.admin.services import get_admin, delete_admin
+
+async def main():
+    if len(sys.argv) >= 2:
+        email = sys.argv[1]
+    else:
+        try:
+            email = input("Admin email: ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nCancelled.")
+            return
+
+    if not email:
+        print("Error: Email is required")
+        sys.exit(1)
+    async with async_session() as session:
+        admin = await get_admin(session=session, email=email)
+        if admin is None:
+            print(f"Error: Admin not found: {email}")
+            sys.exit(1)
+        await delete_admin(session=session, admin=admin)
+
+    print(f"Admin deleted successfully! Email: {email}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
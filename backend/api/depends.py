@@ -1,12 +1,55 @@
-from fastapi import Cookie, Depends, HTTPException, Response, Path
+from fastapi import Cookie, Depends, HTTPException, Request, Response, Path
+from ipaddress import ip_address, ip_network
 from typing import Annotated
-from backend.api.admin.models import Admin
+from backend.api.admin.services import get_admin_principal
 from backend.api.config import settings
 from backend.api.database import get_db
+from backend.api.ttl_cache import TTLCache
 from sqlalchemy.ext.asyncio import AsyncSession
+import hashlib
+import time
 import jwt
 
 
+token_cache = TTLCache(maxsize=settings.jwt_cache_size)
+trusted_proxies = [ip_network(network.strip()) for network in settings.trusted_proxies.split(",") if network.strip()]
+
+
+def is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted_proxies)
+
+
+def get_client_ip(request: Request) -> str | None:
+    host = request.client.host if request.client else None
+    real_ip = request.headers.get("X-Real-IP")
+    if host is None or real_ip is None or not is_trusted_proxy(host):
+        return host
+
+    try:
+        return str(ip_address(real_ip.strip()))
+    except ValueError:
+        return host
+
+
+def decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    expires_at = time.time() + settings.jwt_cache_ttl
+    if "exp" in payload:
+        expires_at = min(expires_at, float(payload["exp"]))
+    token_cache.set(key, payload, expires_at)
+
+    return payload
+
+
 def get_current_telegram_id(
     access_token: str | None = Cookie(default=None)
 ) -> str:
@@ -14,7 +57,7 @@ def get_current_telegram_id(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
-        payload = jwt.decode(access_token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = decode_token(access_token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
@@ -33,7 +76,7 @@ def get_optional_telegram_id(
         return None
 
     try:
-        payload = jwt.decode(access_token, settings.secret_key, algorithms=[settings.algorithm])
+        payload = decode_token(access_token)
         telegram_id = payload.get("telegram_id")
         return str(telegram_id) if telegram_id else None
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
@@ -48,18 +91,14 @@ async def get_current_admin(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     try:
-        payload = jwt.decode(
-            admin_access_token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
-        )
+        payload = decode_token(admin_access_token)
         admin_id = payload.get("sub")
         if admin_id is None:
             raise HTTPException(status_code=401, detail="Invalid token payload")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    admin = await session.get(Admin, int(admin_id))
+    admin = await get_admin_principal(session=session, admin_id=int(admin_id))
     if not admin:
         raise HTTPException(status_code=401, detail="Admin not found")
 
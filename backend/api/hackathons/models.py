@@ -1,11 +1,13 @@
 from backend.api.database import Base
-from sqlalchemy import TEXT, INTEGER, Column, DATE, LargeBinary
+from sqlalchemy import TEXT, INTEGER, Column, DATE, ForeignKey
 
 class Hackathon(Base):
     __tablename__='hackathons'
 
     hack_id = Column(INTEGER, nullable=False, autoincrement=True, primary_key=True)
     title = Column(TEXT, nullable=True)
-    pic = Column(LargeBinary, nullable=True)
+    pic_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
+    pic_thumb_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
+    pic_medium_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
     description = Column(TEXT, nullable=True)
-    event_date = Column(DATE, nullable=False)
+    event_date = Column(DATE, nullable=False, index=True)
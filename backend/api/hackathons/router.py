@@ -1,12 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.depends import get_current_admin
 
-from backend.api.hackathons.utils import get_pic_base64
+from backend.api.hackathons.utils import get_pic_url, build_hack_info, hack_info_row
+from backend.api.images import ImageSize, ImageTooLarge, InvalidImage
+from backend.api.blobs.service import blob_response
+from backend.api.blobs.storage import BlobNotFound
+from backend.api.pagination import PageParams, page_params, page_response, parse_fields
+from backend.api.redis.cache import HACKATHONS_LIST_TAG, cached_response, hackathon_key
 from backend.api.admin.models import Admin
-from backend.api.database import get_db
+from backend.api.database import get_db, mark_primary_reads, reads_primary
 from backend.api.hackathons.schemas import HackInfo, UpdateHackInfo, CreateHack
-from backend.api.hackathons.service import update_hack, create_hack, all_hacks, get_hack_by_id, delete_hack
+from backend.api.hackathons.service import update_hack, create_hack, all_hacks, get_hack_by_id, delete_hack, get_hack_pic, update_hack_pic
+from backend.api.uploads import receive_upload
 
 
 router = APIRouter(prefix="/hackathons", tags=["hackathons"])
@@ -17,38 +26,54 @@ router = APIRouter(prefix="/hackathons", tags=["hackathons"])
 #Общедоступные методы -----------------------------------------------------------------------------------------------------------------
 @router.get("", response_model=list[HackInfo])
 async def all_hacks_info(
-    session: AsyncSession = Depends(get_db),
+    request: Request,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
 ):
-    hacks = await all_hacks(session=session)
-
-    return [
-        HackInfo(
-            hack_id=hack.hack_id,
-            title=hack.title or "",
-            description=hack.description or "",
-            pic=get_pic_base64(hack.pic),
-            event_date=hack.event_date
-        )
-        for hack in hacks if hack
-    ]
+    selected_fields = parse_fields(fields, HackInfo)
+
+    async def load(session: AsyncSession) -> Response:
+        hacks, next_cursor = await all_hacks(session=session, page=page, date_from=date_from, date_to=date_to)
+        return page_response([hack_info_row(hack) for hack in hacks], next_cursor, selected_fields)
+
+    key = f"{HACKATHONS_LIST_TAG}:{date_from}:{date_to}:{fields}:{page.cursor}:{page.limit}"
+    return await cached_response(key, load, tags=(HACKATHONS_LIST_TAG,), prefer_primary=reads_primary(request))
 
 @router.get("/{hack_id}", response_model=HackInfo)
 async def hack_info(
     hack_id: int,
+    request: Request,
+) -> Response:
+    async def load(session: AsyncSession) -> Response:
+        hack = await get_hack_by_id(session=session, hack_id=hack_id)
+
+        if not hack:
+            raise HTTPException(status_code=404, detail="Hack not found")
+
+        return JSONResponse(build_hack_info(hack, pic_size="medium").model_dump(mode="json"))
+
+    return await cached_response(hackathon_key(hack_id), load, prefer_primary=reads_primary(request))
+
+
+@router.get("/{hack_id}/pic")
+async def hack_pic(
+    hack_id: int,
+    request: Request,
+    size: ImageSize = "original",
     session: AsyncSession = Depends(get_db),
-) -> HackInfo:
-    hack = await get_hack_by_id(session=session, hack_id=hack_id)
+) -> Response:
+    pic = await get_hack_pic(session=session, hack_id=hack_id, size=size)
 
-    if not hack:
-        raise HTTPException(status_code=404, detail="Hack not found")
+    if not pic:
+        raise HTTPException(status_code=404, detail="Picture not found")
 
-    return HackInfo(
-        hack_id=hack.hack_id,
-        title=hack.title or "",
-        description=hack.description or "",
-        pic=get_pic_base64(hack.pic),
-        event_date=hack.event_date
-    )
+    version, blob = pic
+    try:
+        return await blob_response(request, blob, version=version)
+    except BlobNotFound:
+        raise HTTPException(status_code=404, detail="Picture not found")
 #-----------------------------------------------------------------------------------------------------------------------------------------
 
 
@@ -57,6 +82,7 @@ async def hack_info(
 async def update_hack_info(
     hack_id: int,
     data: UpdateHackInfo,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     admin: Admin = Depends(get_current_admin)
 ) -> HackInfo:
@@ -64,22 +90,46 @@ async def update_hack_info(
     if not hack:
         raise HTTPException(status_code=404, detail="Hack not found or already deleted")
 
-    hack = await update_hack(
-        session=session,
-        hack=hack,
-        title=data.title,
-        description=data.description,
-        pic=data.pic,
-        event_date=data.event_date,
-    )
+    try:
+        hack = await update_hack(
+            session=session,
+            hack=hack,
+            title=data.title,
+            description=data.description,
+            pic=data.pic,
+            event_date=data.event_date,
+        )
+    except ImageTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except InvalidImage as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    return HackInfo(
-        hack_id=hack.hack_id,
-        title=hack.title or "",
-        description=hack.description or "",
-        pic=get_pic_base64(hack.pic),
-        event_date=hack.event_date
-    )
+    mark_primary_reads(response)
+    return build_hack_info(hack, pic_size="medium")
+
+
+@router.post("/{hack_id}/upload_pic", response_model=HackInfo)
+async def upload_hack_pic(
+    hack_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_db),
+    admin: Admin = Depends(get_current_admin)
+) -> HackInfo:
+    hack = await get_hack_by_id(session=session, hack_id=hack_id)
+    if not hack:
+        raise HTTPException(status_code=404, detail="Hack not found or already deleted")
+
+    try:
+        async with receive_upload(request, field="pic") as upload_path:
+            hack = await update_hack_pic(session=session, hack=hack, upload_path=upload_path)
+    except ImageTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except InvalidImage as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    mark_primary_reads(response)
+    return build_hack_info(hack, pic_size="medium")
 
 
 @router.post("/{hack_id}/delete_hack")
@@ -102,6 +152,7 @@ async def delete_hack_info(
 @router.post("/create_hack", response_model=HackInfo)
 async def create_hack_endpoint(
         data: CreateHack,
+        response: Response,
         session: AsyncSession = Depends(get_db),
         admin: Admin = Depends(get_current_admin)
 ) -> HackInfo:
@@ -111,12 +162,7 @@ async def create_hack_endpoint(
                                  description=data.description,
                                  pic=data.pic,
                                  event_date=data.event_date)
-        pic_base64 = ""
-        try:
-            pic_base64 = get_pic_base64(hack.pic)
-        except Exception:
-            pic_base64 = ""
-
+        mark_primary_reads(response)
         hack_id = getattr(hack, 'hack_id', None)
         if hack_id is None:
             raise HTTPException(status_code=500, detail="Failed to create hack: hack_id is None")
@@ -132,9 +178,13 @@ async def create_hack_endpoint(
             hack_id=hack_id,
             title=title,
             description=description,
-            pic=pic_base64,
+            pic=get_pic_url(hack_id, hack.pic_hash, "medium"),
             event_date=event_date
         )
+    except ImageTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except InvalidImage as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating hack: {str(e)}")
 
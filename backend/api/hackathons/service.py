@@ -1,59 +1,126 @@
 from backend.api.hackathons.models import Hackathon
-from backend.api.hackathons.utils import decode_pic_base64
+from backend.api.pagination import PageParams, paginate, split_page
+from backend.api.images import ImageSize, decode_base64_image
+from backend.api.image_pipeline import process_image_async, process_image_file_async
+from backend.api.blobs.models import Blob
+from backend.api.blobs.service import StoredImage, store_image, store_image_file
+from backend.api.redis.cache import HACKATHONS_LIST_TAG, hackathon_key, invalidate
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import load_only
 from datetime import date
 
 
+HACK_INFO_FIELDS = (
+    Hackathon.hack_id,
+    Hackathon.title,
+    Hackathon.description,
+    Hackathon.event_date,
+    Hackathon.pic_hash,
+)
+
+HACK_INFO_COLUMNS = load_only(*HACK_INFO_FIELDS)
+
 
 
 
 async def get_hack_by_id(session: AsyncSession, hack_id: int) -> Hackathon | None:
     result = await session.execute(
-        select(Hackathon).where(Hackathon.hack_id == hack_id)
+        select(Hackathon).options(HACK_INFO_COLUMNS).where(Hackathon.hack_id == hack_id)
     )
     hack = result.scalars().first()
     return hack
 
-async def all_hacks(session: AsyncSession) -> list[Hackathon]:
-    result = await session.execute(select(Hackathon))
-    return result.scalars().all()
+PIC_COLUMNS = {
+    "thumb": Hackathon.pic_thumb_hash,
+    "medium": Hackathon.pic_medium_hash,
+}
+
+async def get_hack_pic(session: AsyncSession, hack_id: int, size: ImageSize = "original") -> tuple[str, Blob] | None:
+    column = func.coalesce(PIC_COLUMNS[size], Hackathon.pic_hash) if size in PIC_COLUMNS else Hackathon.pic_hash
+    result = await session.execute(
+        select(Hackathon.pic_hash, Blob)
+        .join(Blob, Blob.hash == column)
+        .where(Hackathon.hack_id == hack_id)
+    )
+    return result.first()
+
+async def all_hacks(
+    session: AsyncSession,
+    page: PageParams,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> tuple[list[Row], int | None]:
+    query = select(*HACK_INFO_FIELDS)
+    if date_from is not None:
+        query = query.where(Hackathon.event_date >= date_from)
+    if date_to is not None:
+        query = query.where(Hackathon.event_date <= date_to)
+
+    result = await session.execute(paginate(query, Hackathon.hack_id, page))
+    return split_page(result.all(), page, key=lambda hack: hack.hack_id)
+
+
+async def store_pic(session: AsyncSession, pic: str) -> StoredImage | None:
+    pic_bytes = decode_base64_image(pic)
+    if pic_bytes is None:
+        return None
+    processed = await process_image_async(pic_bytes)
+    return await store_image(session, processed)
+
+
+def set_pic(hack: Hackathon, stored: StoredImage | None) -> None:
+    hack.pic_hash = stored.original_hash if stored else None
+    hack.pic_thumb_hash = stored.thumb_hash if stored else None
+    hack.pic_medium_hash = stored.medium_hash if stored else None
 
 
 async def create_hack(session: AsyncSession, description: str, pic: str, event_date: date, title: str) -> Hackathon:
-    pic_bytes = decode_pic_base64(pic)
+    stored = await store_pic(session, pic)
     
     new_hack = Hackathon(
         title=title,
-        pic=pic_bytes,
         description=description,
         event_date=event_date,
     )
+    set_pic(new_hack, stored)
 
     session.add(new_hack)
     await session.commit()
-    await session.refresh(new_hack)
+    await invalidate(tags=(HACKATHONS_LIST_TAG,))
 
     return new_hack
 
 
 async def update_hack(session: AsyncSession, hack: Hackathon, title: str, description: str, pic: str, event_date: date) -> Hackathon:
-    pic_bytes = decode_pic_base64(pic)
+    stored = await store_pic(session, pic)
 
     hack.title = title
     hack.description = description
-    hack.pic = pic_bytes
+    set_pic(hack, stored)
     hack.event_date = event_date
 
     await session.commit()
-    await session.refresh(hack)
+    await invalidate(hackathon_key(hack.hack_id), tags=(HACKATHONS_LIST_TAG,))
+
+    return hack
+
+
+async def update_hack_pic(session: AsyncSession, hack: Hackathon, upload_path: str) -> Hackathon:
+    processed = await process_image_file_async(upload_path, f"{upload_path}.original")
+    set_pic(hack, await store_image_file(session, processed))
+
+    await session.commit()
+    await invalidate(hackathon_key(hack.hack_id), tags=(HACKATHONS_LIST_TAG,))
 
     return hack
 
 async def delete_hack(session: AsyncSession, hack: Hackathon) -> None:
+    hack_id = hack.hack_id
     await session.delete(hack)
     await session.flush()
     await session.commit()
     session.expunge(hack)
+    await invalidate(hackathon_key(hack_id), tags=(HACKATHONS_LIST_TAG,))
 
 
@@ -1,47 +1,23 @@
-import base64
-import binascii
+from sqlalchemy import Row
 
+from backend.api.images import ImageSize, image_url
+from backend.api.hackathons.models import Hackathon
+from backend.api.hackathons.schemas import HackInfo
 
-def decode_pic_base64(pic_str: str | None) -> bytes | None:
-    if not pic_str or not pic_str.strip():
-        return None
-    try:
-        pic_cleaned = pic_str.strip()
-        if ',' in pic_cleaned:
-            pic_cleaned = pic_cleaned.split(',')[-1]
-        valid_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')
-        if not all(c in valid_chars for c in pic_cleaned):
-            return None
-        missing_padding = len(pic_cleaned) % 4
-        if missing_padding:
-            pic_cleaned += '=' * (4 - missing_padding)
-        pic_bytes = base64.b64decode(pic_cleaned, validate=True)
-        return pic_bytes
-        
-    except (ValueError, TypeError, binascii.Error, Exception):
-        return None
 
+def get_pic_url(hack_id: int, pic_hash: str | None, size: ImageSize = "thumb") -> str:
+    return image_url(f"/api/hackathons/{hack_id}/pic", pic_hash, size)
 
-def get_pic_base64(pic_data) -> str:
-    if pic_data is None:
-        return ""
-    if isinstance(pic_data, str):
-        return pic_data
-    if isinstance(pic_data, memoryview):
-        try:
-            return base64.b64encode(pic_data.tobytes()).decode()
-        except Exception:
-            return ""
-    if isinstance(pic_data, bytes):
-        try:
-            return base64.b64encode(pic_data).decode()
-        except Exception:
-            return ""
-    try:
-        if hasattr(pic_data, 'tobytes'):
-            return base64.b64encode(pic_data.tobytes()).decode()
-        if hasattr(pic_data, '__bytes__'):
-            return base64.b64encode(bytes(pic_data)).decode()
-        return ""
-    except Exception:
-        return ""
\ No newline at end of file
+
+def hack_info_row(hack: Hackathon | Row, pic_size: ImageSize = "thumb") -> dict:
+    return {
+        "hack_id": hack.hack_id,
+        "title": hack.title or "",
+        "description": hack.description or "",
+        "pic": get_pic_url(hack.hack_id, hack.pic_hash, pic_size),
+        "event_date": hack.event_date,
+    }
+
+
+def build_hack_info(hack: Hackathon | Row, pic_size: ImageSize = "thumb") -> HackInfo:
+    return HackInfo(**hack_info_row(hack, pic_size))
\ No newline at end of file
@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+from typing import BinaryIO, Iterator
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from backend.api.config import settings
+from backend.api.images import ImageTooLarge, InvalidImage
+
+
+ALLOWED_FORMATS = {"JPEG", "PNG", "GIF", "WEBP"}
+RENDITION_SIZES = {
+    "thumb": 320,
+    "medium": 1024,
+}
+ENCODE_OPTIONS = {
+    "JPEG": {"quality": 90},
+    "WEBP": {"quality": 90},
+}
+RENDITION_QUALITY = 80
+
+Image.MAX_IMAGE_PIXELS = settings.max_image_pixels
+
+
+@dataclass
+class ProcessedImage:
+    original: bytes
+    thumb: bytes
+    medium: bytes
+
+
+@dataclass
+class ProcessedImageFile:
+    original_path: str
+    original_hash: str
+    original_size: int
+    content_type: str
+    thumb: bytes
+    medium: bytes
+
+
+def _save_stripped(image: Image.Image, image_format: str, output: BinaryIO) -> None:
+    if getattr(image, "is_animated", False):
+        image.save(output, format=image_format, save_all=True)
+    else:
+        image.save(output, format=image_format, **ENCODE_OPTIONS.get(image_format, {}))
+
+
+def _strip_metadata(image: Image.Image, image_format: str) -> bytes:
+    output = BytesIO()
+    _save_stripped(image, image_format, output)
+    return output.getvalue()
+
+
+def _rendition(image: Image.Image, size: int) -> bytes:
+    rendition = image.copy()
+    rendition.thumbnail((size, size), Image.Resampling.LANCZOS)
+    if rendition.mode not in ("RGB", "RGBA"):
+        rendition = rendition.convert("RGBA" if "A" in rendition.getbands() or "transparency" in rendition.info else "RGB")
+
+    output = BytesIO()
+    rendition.save(output, format="WEBP", quality=RENDITION_QUALITY)
+    return output.getvalue()
+
+
+def _renditions(image: Image.Image) -> dict[str, bytes]:
+    return {name: _rendition(image, size) for name, size in RENDITION_SIZES.items()}
+
+
+def _check_size(size: int) -> None:
+    if size > settings.max_image_size:
+        raise ImageTooLarge(f"Image is larger than {settings.max_image_size} bytes")
+
+
+@contextmanager
+def _open_image(source: bytes | str) -> Iterator[tuple[Image.Image, str]]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", Image.DecompressionBombWarning)
+        try:
+            with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as image:
+                image_format = image.format
+                if image_format not in ALLOWED_FORMATS:
+                    raise InvalidImage(f"Unsupported image format: {image_format}")
+                image.verify()
+
+            with Image.open(BytesIO(source) if isinstance(source, bytes) else source) as image:
+                if not getattr(image, "is_animated", False):
+                    image = ImageOps.exif_transpose(image)
+                yield image, image_format
+        except (UnidentifiedImageError, Image.DecompressionBombError, Image.DecompressionBombWarning, OSError, SyntaxError) as e:
+            raise InvalidImage("File is not a valid image") from e
+
+
+def process_image(data: bytes) -> ProcessedImage:
+    _check_size(len(data))
+
+    with _open_image(data) as (image, image_format):
+        return ProcessedImage(original=_strip_metadata(image, image_format), **_renditions(image))
+
+
+def process_image_file(path: str, original_path: str) -> ProcessedImageFile:
+    _check_size(os.path.getsize(path))
+
+    with _open_image(path) as (image, image_format):
+        with open(original_path, "w+b") as output:
+            _save_stripped(image, image_format, output)
+            output.seek(0)
+            original_hash = hashlib.file_digest(output, "sha256").hexdigest()
+            original_size = output.tell()
+
+        return ProcessedImageFile(
+            original_path=original_path,
+            original_hash=original_hash,
+            original_size=original_size,
+            content_type=Image.MIME[image_format],
+            **_renditions(image),
+        )
+
+
+_executor: ProcessPoolExecutor | None = None
+
+
+def get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=settings.image_workers)
+    return _executor
+
+
+async def process_image_async(data: bytes) -> ProcessedImage:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), process_image, data)
+
+
+async def process_image_file_async(path: str, original_path: str) -> ProcessedImageFile:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), process_image_file, path, original_path)
@@ -0,0 +1,115 @@
+import binascii
+from typing import Literal
+
+from backend.api.config import settings
+
+
+ImageSize = Literal["thumb", "medium", "original"]
+
+
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def image_url(path: str, version: str | None, size: ImageSize = "original") -> str:
+    if not version:
+        return ""
+    if size == "original":
+        return f"{path}?v={version}"
+    return f"{path}?size={size}&v={version}"
+
+
+def sniff_image_type(data: bytes) -> str:
+    for signature, media_type in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return media_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [value.strip().removeprefix("W/").strip('"') for value in if_none_match.split(",")]
+    return etag in candidates
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+class ImageTooLarge(InvalidImage):
+    pass
+
+
+DATA_URL_PREFIX = b"data:"
+DATA_URL_HEADER_LIMIT = 256
+WHITESPACE = frozenset(b" \t\r\n")
+
+
+def _strip(view: memoryview) -> memoryview:
+    start, end = 0, len(view)
+    while start < end and view[start] in WHITESPACE:
+        start += 1
+    while end > start and view[end - 1] in WHITESPACE:
+        end -= 1
+    return view[start:end]
+
+
+def parse_data_url(view: memoryview) -> tuple[str | None, memoryview]:
+    if view[:len(DATA_URL_PREFIX)] != DATA_URL_PREFIX:
+        return None, view
+
+    comma = bytes(view[:DATA_URL_HEADER_LIMIT]).find(b",")
+    if comma == -1:
+        raise InvalidImage("Malformed data URL")
+
+    header = bytes(view[len(DATA_URL_PREFIX):comma]).decode("ascii")
+    if not header.endswith(";base64"):
+        raise InvalidImage("Data URL is not base64 encoded")
+
+    return header.split(";")[0] or None, view[comma + 1:]
+
+
+def decode_base64_image(value: str | None, max_size: int | None = None) -> bytes | None:
+    if not value:
+        return None
+
+    try:
+        raw = value.encode("ascii")
+    except UnicodeEncodeError:
+        raise InvalidImage("Image is not valid base64")
+
+    _, payload = parse_data_url(_strip(memoryview(raw)))
+    payload = _strip(payload)
+    if not payload:
+        return None
+
+    max_size = settings.max_image_size if max_size is None else max_size
+    padding = 2 if payload[-2:] == b"==" else int(payload[-1:] == b"=")
+    if len(payload) * 3 // 4 - padding > max_size:
+        raise ImageTooLarge(f"Image is larger than {max_size} bytes")
+
+    missing_padding = -len(payload) % 4
+    if missing_padding:
+        payload = bytes(payload) + b"=" * missing_padding
+
+    try:
+        return binascii.a2b_base64(payload, strict_mode=True)
+    except binascii.Error:
+        raise InvalidImage("Image is not valid base64")
+
+
+def encode_base64_image(data: bytes, media_type: str | None = None) -> str:
+    encoded = binascii.b2a_base64(data, newline=False).decode("ascii")
+    return f"data:{media_type};base64,{encoded}" if media_type else encoded
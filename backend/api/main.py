@@ -1,13 +1,16 @@
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from backend.api.database import create_all_tables
+from backend.api.migrate import verify_schema_revision
 from backend.api.config import settings
-from backend.api.redis.redis_client import redis_client
+from backend.api.depends import get_client_ip
+from backend.api.redis.login_codes import LoginCodeThrottled, redeem_login_code
+from backend.api.redis.redis_client import close_redis_client
 from backend.api.profile.router import router as profile_router
 from backend.api.hackathons.router import router as hackathons_router
 from backend.api.admin.router import router as admin_router
+from backend.api.teams.router import router as teams_router
 
 
 import jwt
@@ -18,6 +21,7 @@ app = FastAPI(title="ITAMHack API", prefix="/api")
 app.include_router(admin_router, prefix="/api")
 app.include_router(profile_router, prefix="/api")
 app.include_router(hackathons_router, prefix="/api")
+app.include_router(teams_router, prefix="/api")
 
 
 app.add_middleware(
@@ -31,7 +35,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-User-Id", "X-User-Name", "Editable"],
+    expose_headers=["X-User-Id", "X-User-Name", "Editable", "X-Next-Cursor"],
 )
 SECRET = settings.secret_key
 
@@ -41,22 +45,24 @@ class CodeInput(BaseModel):
 
 @app.on_event("startup")
 async def on_startup():
-    await create_all_tables()
+    await verify_schema_revision()
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    await close_redis_client()
 
-@app.post("/login-by-code")
-async def login_by_code(data: CodeInput, response: Response):
-    key = data.code
 
-    telegram_id_str = await redis_client.get(key)
+@app.post("/login-by-code")
+async def login_by_code(data: CodeInput, request: Request, response: Response):
+    try:
+        telegram_id = await redeem_login_code(data.code, get_client_ip(request))
+    except LoginCodeThrottled:
+        raise HTTPException(status_code=429, detail="Слишком много попыток, попробуйте позже")
 
-    if telegram_id_str is None:
+    if telegram_id is None:
         raise HTTPException(status_code=400, detail="Неверный или просроченный код")
 
-    await redis_client.delete(key)
-    telegram_id = telegram_id_str.decode() if isinstance(telegram_id_str, bytes) else telegram_id_str
-
     token = jwt.encode(
         {"telegram_id": telegram_id, "exp": int(time.time()) + settings.access_token_expire_minutes * 60},
         SECRET,
@@ -0,0 +1,236 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from backend.api.database import Base, engine
+from backend.api.images import InvalidImage
+from backend.api.image_pipeline import ProcessedImage, process_image_async
+from backend.api.blobs.service import store_blob, store_image
+import backend.api.models
+import backend.api.blobs.models
+import backend.api.admin.models
+import backend.api.hackathons.models
+import backend.api.teams.models
+
+
+MIGRATIONS_PATH = Path(__file__).resolve().parent / "migrations"
+LEGACY_REVISION = "0001_initial"
+MIGRATION_LOCK_ID = 7261001
+
+
+def alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_PATH))
+    return config
+
+
+def head_revision() -> str:
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+async def current_revision(conn: AsyncConnection) -> str | None:
+    return await conn.run_sync(lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision())
+
+
+async def verify_schema_revision() -> None:
+    async with engine.connect() as conn:
+        current = await current_revision(conn)
+
+    expected = head_revision()
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, expected {expected}. "
+            "Run `python -m backend.api.migrate` first."
+        )
+
+
+def run_command(sync_conn: Connection, alembic_command, *args, **kwargs) -> None:
+    config = alembic_config()
+    config.attributes["connection"] = sync_conn
+    alembic_command(config, *args, **kwargs)
+
+
+async def table_exists(conn: AsyncConnection, table: str) -> bool:
+    result = await conn.execute(text("SELECT to_regclass(:table)"), {"table": table})
+    return result.scalar() is not None
+
+
+async def column_exists(conn: AsyncConnection, table: str, column: str) -> bool:
+    result = await conn.execute(
+        text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column},
+    )
+    return result.scalar() is not None
+
+
+async def migrate_team_members(conn: AsyncConnection) -> None:
+    if not await column_exists(conn, "teams", "participants_id"):
+        return
+
+    await conn.execute(text("""
+        INSERT INTO team_members (team_id, telegram_id, joined_at)
+        SELECT teams.team_id, users.telegram_id, now() + participant.position * interval '1 microsecond'
+        FROM teams
+        CROSS JOIN LATERAL jsonb_array_elements_text(teams.participants_id)
+            WITH ORDINALITY AS participant(telegram_id, position)
+        JOIN users ON users.telegram_id = participant.telegram_id
+        WHERE jsonb_typeof(teams.participants_id) = 'array'
+        ON CONFLICT DO NOTHING
+    """))
+    await conn.execute(text("ALTER TABLE teams DROP COLUMN participants_id"))
+
+
+async def create_missing_indexes(conn: AsyncConnection) -> None:
+    def create_indexes(sync_conn):
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(sync_conn, checkfirst=True)
+
+    await conn.run_sync(create_indexes)
+
+
+LEGACY_IMAGE_COLUMNS = (
+    ("users", "id", "avatar"),
+    ("hackathons", "hack_id", "pic"),
+)
+
+
+async def add_image_renditions(conn: AsyncConnection) -> None:
+    for table, key, column in LEGACY_IMAGE_COLUMNS:
+        if not await column_exists(conn, table, column):
+            continue
+
+        await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column}_thumb BYTEA"))
+        await conn.execute(text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column}_medium BYTEA"))
+
+        result = await conn.execute(text(
+            f"SELECT {key} FROM {table} WHERE {column} IS NOT NULL AND {column}_thumb IS NULL"
+        ))
+        for row_id in result.scalars().all():
+            data = await conn.scalar(text(f"SELECT {column} FROM {table} WHERE {key} = :id"), {"id": row_id})
+            try:
+                processed = await process_image_async(data)
+            except InvalidImage:
+                print(f"Skipping invalid image in {table}.{column} for {key}={row_id}")
+                continue
+            await conn.execute(
+                text(
+                    f"UPDATE {table} SET {column} = :original, {column}_thumb = :thumb, {column}_medium = :medium "
+                    f"WHERE {key} = :id"
+                ),
+                {"id": row_id, "original": processed.original, "thumb": processed.thumb, "medium": processed.medium},
+            )
+
+
+async def move_images_to_blob_store(conn: AsyncConnection) -> None:
+    session = AsyncSession(bind=conn)
+
+    for table, key, column in LEGACY_IMAGE_COLUMNS:
+        for suffix in ("", "_thumb", "_medium"):
+            await conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column}{suffix}_hash TEXT REFERENCES blobs (hash)"
+            ))
+
+        if not await column_exists(conn, table, column):
+            continue
+
+        result = await conn.execute(text(
+            f"SELECT {key} FROM {table} WHERE {column} IS NOT NULL AND {column}_hash IS NULL"
+        ))
+        for row_id in result.scalars().all():
+            original, thumb, medium = (await conn.execute(
+                text(f"SELECT {column}, {column}_thumb, {column}_medium FROM {table} WHERE {key} = :id"),
+                {"id": row_id},
+            )).one()
+            if thumb is None or medium is None:
+                print(f"Storing image without renditions in {table}.{column} for {key}={row_id}")
+                await conn.execute(
+                    text(f"UPDATE {table} SET {column}_hash = :original WHERE {key} = :id"),
+                    {"id": row_id, "original": await store_blob(session, original)},
+                )
+                continue
+
+            stored = await store_image(session, ProcessedImage(original=original, thumb=thumb, medium=medium))
+            await conn.execute(
+                text(
+                    f"UPDATE {table} SET {column}_hash = :original, {column}_thumb_hash = :thumb, "
+                    f"{column}_medium_hash = :medium WHERE {key} = :id"
+                ),
+                {"id": row_id, "original": stored.original_hash, "thumb": stored.thumb_hash, "medium": stored.medium_hash},
+            )
+
+        for suffix in ("", "_thumb", "_medium"):
+            await conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}{suffix}"))
+
+
+async def add_avatar_sync_columns(conn: AsyncConnection) -> None:
+    await conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS avatar_file_unique_id TEXT"))
+    await conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS avatar_synced_at TIMESTAMP WITH TIME ZONE"))
+
+
+STEPS = [
+    migrate_team_members,
+    add_image_renditions,
+    move_images_to_blob_store,
+    add_avatar_sync_columns,
+    create_missing_indexes,
+]
+
+
+async def upgrade_legacy_schema(conn: AsyncConnection) -> None:
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await conn.run_sync(Base.metadata.create_all)
+
+    for step in STEPS:
+        print(f"Running {step.__name__}...")
+        await step(conn)
+
+    await conn.run_sync(run_command, command.stamp, LEGACY_REVISION)
+
+
+async def upgrade(revision: str = "head") -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+        if await current_revision(conn) is None and await table_exists(conn, "users"):
+            print("Found a schema created before versioned migrations, bringing it up to date...")
+            await upgrade_legacy_schema(conn)
+
+        await conn.run_sync(run_command, command.upgrade, revision)
+
+
+async def main():
+    args = sys.argv[1:] or ["upgrade"]
+    action = args[0]
+
+    if action == "upgrade":
+        await upgrade(args[1] if len(args) > 1 else "head")
+    elif action == "downgrade" and len(args) == 2:
+        async with engine.begin() as conn:
+            await conn.run_sync(run_command, command.downgrade, args[1])
+    elif action == "current":
+        async with engine.connect() as conn:
+            print(f"Current revision: {await current_revision(conn)}, head: {head_revision()}")
+    elif action == "revision" and len(args) == 2:
+        async with engine.connect() as conn:
+            await conn.run_sync(run_command, command.revision, message=args[1], autogenerate=True)
+    else:
+        print("Usage: python -m backend.api.migrate [upgrade [revision] | downgrade <revision> | current | revision <message>]")
+        sys.exit(1)
+
+    await engine.dispose()
+    print("Done!")
+
+if __name__ == "__main__":
+    asyncio.run(main())
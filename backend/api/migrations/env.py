@@ -0,0 +1,45 @@
+import asyncio
+
+from alembic import context
+from sqlalchemy.engine import Connection
+
+from backend.api.database import Base, engine
+import backend.api.models
+import backend.api.blobs.models
+import backend.api.admin.models
+import backend.api.hackathons.models
+import backend.api.teams.models
+
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+        await connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+elif context.config.attributes.get("connection") is not None:
+    do_run_migrations(context.config.attributes["connection"])
+else:
+    asyncio.run(run_async_migrations())
@@ -0,0 +1,124 @@
+"""initial schema
+
+Revision ID: 0001_initial
+Revises:
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = '0001_initial'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+SEARCH_TEXT = "(coalesce(fullname, '') || ' ') || coalesce(description, '')"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_table(
+        'admins',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.TEXT(), nullable=False),
+        sa.Column('password_hash', sa.TEXT(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email'),
+    )
+    op.create_index('ix_admins_id', 'admins', ['id'])
+
+    op.create_table(
+        'blobs',
+        sa.Column('hash', sa.TEXT(), nullable=False),
+        sa.Column('content_type', sa.TEXT(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('hash'),
+    )
+
+    op.create_table(
+        'teams',
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('password', sa.TEXT(), nullable=False),
+        sa.Column('title', sa.TEXT(), nullable=True),
+        sa.Column('description', sa.TEXT(), nullable=True),
+        sa.Column('captain_id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('team_id'),
+    )
+
+    op.create_table(
+        'hackathons',
+        sa.Column('hack_id', sa.INTEGER(), nullable=False),
+        sa.Column('title', sa.TEXT(), nullable=True),
+        sa.Column('pic_hash', sa.TEXT(), nullable=True),
+        sa.Column('pic_thumb_hash', sa.TEXT(), nullable=True),
+        sa.Column('pic_medium_hash', sa.TEXT(), nullable=True),
+        sa.Column('description', sa.TEXT(), nullable=True),
+        sa.Column('event_date', sa.DATE(), nullable=False),
+        sa.ForeignKeyConstraint(['pic_hash'], ['blobs.hash']),
+        sa.ForeignKeyConstraint(['pic_thumb_hash'], ['blobs.hash']),
+        sa.ForeignKeyConstraint(['pic_medium_hash'], ['blobs.hash']),
+        sa.PrimaryKeyConstraint('hack_id'),
+    )
+
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('telegram_id', sa.TEXT(), nullable=False),
+        sa.Column('username', sa.TEXT(), nullable=True),
+        sa.Column('fullname', sa.TEXT(), nullable=True),
+        sa.Column('description', sa.TEXT(), nullable=True),
+        sa.Column('role', sa.TEXT(), nullable=True),
+        sa.Column('tags', postgresql.JSONB(), nullable=True),
+        sa.Column('avatar_hash', sa.TEXT(), nullable=True),
+        sa.Column('avatar_thumb_hash', sa.TEXT(), nullable=True),
+        sa.Column('avatar_medium_hash', sa.TEXT(), nullable=True),
+        sa.Column('avatar_file_unique_id', sa.TEXT(), nullable=True),
+        sa.Column('avatar_synced_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('date_registration', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['avatar_hash'], ['blobs.hash']),
+        sa.ForeignKeyConstraint(['avatar_thumb_hash'], ['blobs.hash']),
+        sa.ForeignKeyConstraint(['avatar_medium_hash'], ['blobs.hash']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_telegram_id', 'users', ['telegram_id'], unique=True)
+    op.create_index('ix_users_role', 'users', ['role'])
+    op.create_index('ix_users_avatar_synced_at', 'users', ['avatar_synced_at'])
+    op.create_index('ix_users_tags', 'users', ['tags'], postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'})
+    op.create_index(
+        'ix_users_search_vector',
+        'users',
+        [sa.text(f"to_tsvector('simple'::regconfig, {SEARCH_TEXT})")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_users_search_trgm',
+        'users',
+        [sa.text(f"({SEARCH_TEXT}) gin_trgm_ops")],
+        postgresql_using='gin',
+    )
+
+    op.create_table(
+        'team_members',
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.Column('telegram_id', sa.TEXT(), nullable=False),
+        sa.Column('joined_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.team_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['telegram_id'], ['users.telegram_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('team_id', 'telegram_id'),
+    )
+    op.create_index('ix_team_members_telegram_id', 'team_members', ['telegram_id'])
+
+
+def downgrade() -> None:
+    op.drop_table('team_members')
+    op.drop_table('users')
+    op.drop_table('hackathons')
+    op.drop_table('teams')
+    op.drop_table('blobs')
+    op.drop_table('admins')
@@ -0,0 +1,24 @@
+"""index teams by captain and hackathons by event date
+
+Revision ID: 0002_performance_indexes
+Revises: 0001_initial
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = '0002_performance_indexes'
+down_revision = '0001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_teams_captain_id', 'teams', ['captain_id'], if_not_exists=True)
+    op.create_index('ix_hackathons_event_date', 'hackathons', ['event_date'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_hackathons_event_date', table_name='hackathons')
+    op.drop_index('ix_teams_captain_id', table_name='teams')
@@ -0,0 +1,23 @@
+"""store team captain telegram ids as bigint
+
+Revision ID: 0003_teams_captain_bigint
+Revises: 0002_performance_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003_teams_captain_bigint'
+down_revision = '0002_performance_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('teams', 'captain_id', type_=sa.BigInteger(), existing_type=sa.Integer(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('teams', 'captain_id', type_=sa.Integer(), existing_type=sa.BigInteger(), existing_nullable=False)
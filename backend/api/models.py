@@ -1,9 +1,24 @@
-from sqlalchemy import Column, DateTime, Integer, TEXT, LargeBinary
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, TEXT, literal_column
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from backend.api.database import Base
 
 
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+
+def search_text(fullname, description):
+    return (
+        func.coalesce(fullname, literal_column("''"))
+        .op('||')(literal_column("' '"))
+        .op('||')(func.coalesce(description, literal_column("''")))
+    )
+
+
+def search_vector(text):
+    return func.to_tsvector(SEARCH_CONFIG, text)
+
+
 class User(Base):
     __tablename__ = 'users'
     
@@ -14,6 +29,27 @@ class User(Base):
     description = Column(TEXT, nullable=True)
     role = Column(TEXT, nullable=True)
     tags = Column(JSONB, nullable=True)
-    avatar = Column(LargeBinary, nullable=True)
+    avatar_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
+    avatar_thumb_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
+    avatar_medium_hash = Column(TEXT, ForeignKey('blobs.hash'), nullable=True)
+    avatar_file_unique_id = Column(TEXT, nullable=True)
+    avatar_synced_at = Column(DateTime(timezone=True), nullable=True)
     date_registration = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index('ix_users_role', 'role'),
+        Index('ix_users_avatar_synced_at', 'avatar_synced_at'),
+        Index('ix_users_tags', 'tags', postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'}),
+        Index('ix_users_search_vector', search_vector(search_text(fullname, description)), postgresql_using='gin'),
+        Index(
+            'ix_users_search_trgm',
+            search_text(fullname, description).label('search_text'),
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+        ),
+    )
+
+
+USER_SEARCH_TEXT = search_text(User.fullname, User.description)
+USER_SEARCH_VECTOR = search_vector(USER_SEARCH_TEXT)
+
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import orjson
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from backend.api.config import settings
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class PageParams:
+    cursor: int | None
+    limit: int
+
+
+def page_params(
+    cursor: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=settings.default_page_size, ge=1, le=settings.max_page_size),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit)
+
+
+def paginate(query: Select, key_column, page: PageParams) -> Select:
+    if page.cursor is not None:
+        query = query.where(key_column > page.cursor)
+    return query.order_by(key_column).limit(page.limit + 1)
+
+
+def split_page(items: Sequence, page: PageParams, key: Callable[[Any], int]) -> tuple[list, int | None]:
+    items = list(items)
+    if len(items) <= page.limit:
+        return items, None
+
+    items = items[:page.limit]
+    return items, key(items[-1])
+
+
+def parse_fields(fields: str | None, model: type[BaseModel]) -> set[str] | None:
+    if not fields:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    return requested
+
+
+def rows_response(rows: list[dict], fields: set[str] | None = None, headers: dict[str, str] | None = None) -> Response:
+    if fields is not None:
+        rows = [{name: value for name, value in row.items() if name in fields} for row in rows]
+    return Response(content=orjson.dumps(rows), media_type="application/json", headers=headers)
+
+
+def page_response(rows: list[dict], next_cursor: int | None, fields: set[str] | None = None) -> Response:
+    headers = {NEXT_CURSOR_HEADER: str(next_cursor)} if next_cursor is not None else {}
+    return rows_response(rows, fields, headers)
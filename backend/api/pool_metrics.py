@@ -0,0 +1,33 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class CheckoutStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.errors = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @contextmanager
+    def measure(self, *errors: type[BaseException]) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except errors:
+            self.errors += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "checkout_errors": self.errors,
+            "avg_wait_ms": self.wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.wait_max * 1000,
+        }
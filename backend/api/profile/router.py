@@ -1,11 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.api.database import get_db
+from backend.api.config import settings
+from backend.api.database import get_db, get_read_db, mark_primary_reads, reads_primary
 from backend.api.profile.schemas import UserInfo, UserUpdate
-from backend.api.profile.service import get_user_info_by_telegram_id, all_users_info, update_user_info
+from backend.api.profile.service import get_user_info_by_telegram_id, all_users_info, update_user_info, get_user_avatar, search_users
 from backend.api.depends import get_current_telegram_id, check_user_editable
-from backend.api.profile.utils import get_avatar_base64, parse_tags
+from backend.api.profile.utils import build_user_info, user_info_row
+from backend.api.images import ImageSize
+from backend.api.blobs.service import blob_response
+from backend.api.blobs.storage import BlobNotFound
+from backend.api.pagination import PageParams, page_params, page_response, parse_fields, rows_response
+from backend.api.redis.cache import cached_response, participant_key
 
 
 router = APIRouter(prefix="/participants", tags=["participants"])
@@ -13,42 +20,66 @@ router = APIRouter(prefix="/participants", tags=["participants"])
 
 @router.get("", response_model=list[UserInfo])
 async def all_user_profile(
-    session: AsyncSession = Depends(get_db),
+    role: str | None = None,
+    tags: list[str] | None = Query(default=None),
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_read_db),
+):
+    selected_fields = parse_fields(fields, UserInfo)
+    users, next_cursor = await all_users_info(session=session, page=page, role=role, tags=tags)
+
+    return page_response([user_info_row(user) for user in users], next_cursor, selected_fields)
+
+@router.get("/search", response_model=list[UserInfo])
+async def search_user_profiles(
+    q: str | None = Query(default=None, min_length=2),
+    role: str | None = None,
+    tags: list[str] | None = Query(default=None),
+    limit: int = Query(default=settings.default_page_size, ge=1, le=settings.max_page_size),
+    session: AsyncSession = Depends(get_read_db),
 ):
-    users = await all_users_info(session=session)
-
-    return [
-        UserInfo(
-            telegram_id=user.telegram_id,
-            fullname=user.fullname or "",
-            description=user.description or "",
-            role=user.role,
-            pic=get_avatar_base64(user.avatar),
-            tags=parse_tags(user.tags),
-        )
-        for user in users if user
-    ]
+    users = await search_users(session=session, limit=limit, query=q, role=role, tags=tags)
+
+    return rows_response([user_info_row(user) for user in users])
 
 @router.get("/{telegram_id}", response_model=UserInfo)
 async def user_profile(
     telegram_id: str,
+    request: Request,
     response: Response,
-    session: AsyncSession = Depends(get_db),
     _: bool = Depends(check_user_editable),
-) -> UserInfo:
-    user = await get_user_info_by_telegram_id(session=session, telegram_id=telegram_id)
+) -> Response:
+    async def load(session: AsyncSession) -> Response:
+        user = await get_user_info_by_telegram_id(session=session, telegram_id=telegram_id)
 
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return JSONResponse(build_user_info(user, pic_size="medium").model_dump(mode="json"))
+
+    cached = await cached_response(participant_key(telegram_id), load, prefer_primary=reads_primary(request))
+    cached.headers.update(response.headers)
+    return cached
+
+
+@router.get("/{telegram_id}/avatar")
+async def user_avatar(
+    telegram_id: str,
+    request: Request,
+    size: ImageSize = "original",
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    avatar = await get_user_avatar(session=session, telegram_id=telegram_id, size=size)
+
+    if not avatar:
+        raise HTTPException(status_code=404, detail="Avatar not found")
 
-    return UserInfo(
-        telegram_id=user.telegram_id,
-        fullname=user.fullname or "",
-        description=user.description or "",
-        role=user.role,
-        pic=get_avatar_base64(user.avatar),
-        tags=parse_tags(user.tags),
-    )
+    version, blob = avatar
+    try:
+        return await blob_response(request, blob, version=version)
+    except BlobNotFound:
+        raise HTTPException(status_code=404, detail="Avatar not found")
 
 
 @router.post("/{telegram_id}", response_model=UserInfo)
@@ -67,17 +98,11 @@ async def update_user_profile(
         raise HTTPException(status_code=404, detail="User not found")
 
     user = await update_user_info(session=session, user=user, data=data)
+    mark_primary_reads(response)
 
     response.headers["X-User-Id"] = user.telegram_id
     response.headers["Editable"] = "true"
 
-    return UserInfo(
-        telegram_id=user.telegram_id,
-        fullname=user.fullname or "",
-        description=user.description or "",
-        role=user.role,
-        pic=get_avatar_base64(user.avatar),
-        tags=parse_tags(user.tags),
-    )
+    return build_user_info(user, pic_size="medium")
 
 
@@ -1,19 +1,97 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, text
-from backend.api.models import User
+from sqlalchemy import Row, func, or_, select, text
+from sqlalchemy.orm import load_only
+from backend.api.models import User, SEARCH_CONFIG, USER_SEARCH_TEXT, USER_SEARCH_VECTOR
 from backend.api.profile.schemas import UserUpdate
+from backend.api.images import ImageSize
+from backend.api.blobs.models import Blob
+from backend.api.pagination import PageParams, paginate, split_page
+from backend.api.redis.cache import invalidate, participant_key
 
-async def all_users_info(session: AsyncSession) -> list[User]:
-    result = await session.execute(select(User))
-    return result.scalars().all()
+
+USER_INFO_FIELDS = (
+    User.id,
+    User.telegram_id,
+    User.fullname,
+    User.description,
+    User.role,
+    User.tags,
+    User.avatar_hash,
+)
+
+USER_INFO_COLUMNS = load_only(*USER_INFO_FIELDS)
+
+async def all_users_info(
+    session: AsyncSession,
+    page: PageParams,
+    role: str | None = None,
+    tags: list[str] | None = None,
+) -> tuple[list[Row], int | None]:
+    query = select(*USER_INFO_FIELDS)
+    if role is not None:
+        query = query.where(User.role == role)
+    if tags:
+        query = query.where(User.tags.contains(tags))
+
+    result = await session.execute(paginate(query, User.id, page))
+    return split_page(result.all(), page, key=lambda user: user.id)
+
+async def search_users(
+    session: AsyncSession,
+    limit: int,
+    query: str | None = None,
+    role: str | None = None,
+    tags: list[str] | None = None,
+) -> list[Row]:
+    statement = select(*USER_INFO_FIELDS)
+    if role is not None:
+        statement = statement.where(User.role == role)
+    if tags:
+        statement = statement.where(User.tags.contains(tags))
+
+    if query:
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(USER_SEARCH_VECTOR, ts_query) + func.word_similarity(query, USER_SEARCH_TEXT)
+        statement = statement.where(
+            or_(USER_SEARCH_VECTOR.op('@@')(ts_query), USER_SEARCH_TEXT.op('%>')(query))
+        ).order_by(rank.desc(), User.id)
+    else:
+        statement = statement.order_by(User.id)
+
+    result = await session.execute(statement.limit(limit))
+    return result.all()
 
 async def get_user_info_by_telegram_id(session: AsyncSession, telegram_id: str) -> User | None:
     result = await session.execute(
-        select(User).where(User.telegram_id == telegram_id)
+        select(User).options(USER_INFO_COLUMNS).where(User.telegram_id == telegram_id)
     )
     user = result.scalars().first()
     return user
 
+async def get_users_by_telegram_ids(session: AsyncSession, telegram_ids: list[str]) -> list[User]:
+    if not telegram_ids:
+        return []
+
+    result = await session.execute(
+        select(User).options(USER_INFO_COLUMNS).where(User.telegram_id.in_(telegram_ids))
+    )
+    users = {user.telegram_id: user for user in result.scalars().all()}
+    return [users[telegram_id] for telegram_id in dict.fromkeys(telegram_ids) if telegram_id in users]
+
+AVATAR_COLUMNS = {
+    "thumb": User.avatar_thumb_hash,
+    "medium": User.avatar_medium_hash,
+}
+
+async def get_user_avatar(session: AsyncSession, telegram_id: str, size: ImageSize = "original") -> tuple[str, Blob] | None:
+    column = func.coalesce(AVATAR_COLUMNS[size], User.avatar_hash) if size in AVATAR_COLUMNS else User.avatar_hash
+    result = await session.execute(
+        select(User.avatar_hash, Blob)
+        .join(Blob, Blob.hash == column)
+        .where(User.telegram_id == telegram_id)
+    )
+    return result.first()
+
 async def update_user_info(session: AsyncSession, user: User, data: UserUpdate) -> User:
     if data.fullname is not None:
         user.fullname = data.fullname
@@ -25,6 +103,6 @@ async def update_user_info(session: AsyncSession, user: User, data: UserUpdate)
         user.role = data.role
 
     await session.commit()
-    await session.refresh(user)
+    await invalidate(participant_key(user.telegram_id))
     return user
 
@@ -1,7 +1,29 @@
 import json
 
-def get_avatar_base64(avatar_data: str | None) -> str:
-    return avatar_data if avatar_data else ""
+from sqlalchemy import Row
+
+from backend.api.images import ImageSize, image_url
+from backend.api.models import User
+from backend.api.profile.schemas import UserInfo
+
+
+def get_avatar_url(telegram_id: str, avatar_hash: str | None, size: ImageSize = "thumb") -> str:
+    return image_url(f"/api/participants/{telegram_id}/avatar", avatar_hash, size)
+
+
+def user_info_row(user: User | Row, pic_size: ImageSize = "thumb") -> dict:
+    return {
+        "telegram_id": user.telegram_id,
+        "fullname": user.fullname or "",
+        "pic": get_avatar_url(user.telegram_id, user.avatar_hash, pic_size),
+        "role": user.role,
+        "description": user.description or "",
+        "tags": parse_tags(user.tags),
+    }
+
+
+def build_user_info(user: User | Row, pic_size: ImageSize = "thumb") -> UserInfo:
+    return UserInfo(**user_info_row(user, pic_size))
 
 
 def parse_tags(tags: str | list[str] | None) -> list[str]:
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable
+
+from fastapi import Response
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.config import settings
+from backend.api.database import read_session
+from backend.api.redis.redis_client import redis_client
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "cache"
+
+cache_stats = {"hits": 0, "misses": 0, "coalesced": 0, "bypassed": 0, "errors": 0}
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def hackathon_key(hack_id: int) -> str:
+    return f"hackathons:{hack_id}"
+
+
+def participant_key(telegram_id: str) -> str:
+    return f"participants:{telegram_id}"
+
+
+HACKATHONS_LIST_TAG = "hackathons:list"
+
+
+def _cache_key(key: str) -> str:
+    return f"{CACHE_PREFIX}:{key}"
+
+
+def _tag_key(tag: str) -> str:
+    return f"{CACHE_PREFIX}:tag:{tag}"
+
+
+def _build_response(entry: dict[str, str]) -> Response:
+    return Response(
+        content=entry["body"],
+        media_type="application/json",
+        headers=json.loads(entry["headers"]),
+    )
+
+
+async def _read(cache_key: str) -> dict[str, str] | None:
+    try:
+        entry = await redis_client.hgetall(cache_key)
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("Cache read failed for %s", cache_key, exc_info=True)
+        return None
+    return entry or None
+
+
+async def _write(cache_key: str, entry: dict[str, str], ttl: int, tags: tuple[str, ...]) -> None:
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(cache_key, mapping=entry)
+            pipe.expire(cache_key, ttl)
+            for tag in tags:
+                pipe.sadd(_tag_key(tag), cache_key)
+                pipe.expire(_tag_key(tag), ttl)
+            await pipe.execute()
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("Cache write failed for %s", cache_key, exc_info=True)
+
+
+Loader = Callable[[AsyncSession], Awaitable[Response]]
+
+
+async def _load(cache_key: str, loader: Loader, ttl: int, tags: tuple[str, ...], prefer_primary: bool = False) -> dict[str, str] | Response:
+    async with read_session(prefer_primary) as session:
+        response = await loader(session)
+    if response.status_code != 200:
+        return response
+
+    entry = {
+        "body": response.body.decode(),
+        "headers": json.dumps({name: value for name, value in response.headers.items() if name.startswith("x-")}),
+    }
+    await _write(cache_key, entry, ttl, tags)
+    return entry
+
+
+async def cached_response(
+    key: str,
+    loader: Loader,
+    ttl: int | None = None,
+    tags: tuple[str, ...] = (),
+    prefer_primary: bool = False,
+) -> Response:
+    cache_key = _cache_key(key)
+    ttl = ttl or settings.cache_ttl
+
+    if prefer_primary:
+        cache_stats["bypassed"] += 1
+        entry = await _load(cache_key, loader, ttl, tags, prefer_primary=True)
+        if isinstance(entry, Response):
+            return entry
+        return _build_response(entry)
+
+    entry = await _read(cache_key)
+    if entry is not None:
+        cache_stats["hits"] += 1
+        return _build_response(entry)
+
+    cache_stats["misses"] += 1
+    task = _inflight.get(cache_key)
+    if task is None:
+        task = asyncio.create_task(_load(cache_key, loader, ttl, tags))
+        _inflight[cache_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    else:
+        cache_stats["coalesced"] += 1
+
+    entry = await asyncio.shield(task)
+    if isinstance(entry, Response):
+        return entry
+    return _build_response(entry)
+
+
+async def invalidate(*keys: str, tags: tuple[str, ...] = ()) -> None:
+    try:
+        cache_keys = [_cache_key(key) for key in keys]
+        for tag in tags:
+            cache_keys.extend(await redis_client.smembers(_tag_key(tag)))
+            cache_keys.append(_tag_key(tag))
+        if cache_keys:
+            await redis_client.delete(*cache_keys)
+    except RedisError:
+        cache_stats["errors"] += 1
+        logger.warning("Cache invalidation failed for %s", keys or tags, exc_info=True)
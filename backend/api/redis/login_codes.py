@@ -0,0 +1,87 @@
+import secrets
+
+from backend.api.redis.redis_client import redis_client
+from backend.api.config import settings
+
+
+CODE_PREFIX = "login:code:"
+USER_PREFIX = "login:user:"
+ATTEMPTS_PREFIX = "login:attempts:"
+CODE_ATTEMPTS_PREFIX = "login:attempts:code:"
+
+
+ISSUE_SCRIPT = redis_client.register_script("""
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return 0
+end
+if not redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+    return 0
+end
+local previous = redis.call('GET', KEYS[2])
+if previous then
+    redis.call('DEL', ARGV[3] .. previous)
+end
+redis.call('SET', KEYS[2], ARGV[4], 'EX', ARGV[2])
+return 1
+""")
+
+REDEEM_SCRIPT = redis_client.register_script("""
+local client_attempts = tonumber(redis.call('GET', KEYS[2]) or '0')
+local code_attempts = tonumber(redis.call('GET', KEYS[3]) or '0')
+if client_attempts >= tonumber(ARGV[1]) or code_attempts >= tonumber(ARGV[5]) then
+    return {'throttled'}
+end
+local telegram_id = redis.call('GETDEL', KEYS[1])
+if not telegram_id then
+    for i = 2, 3 do
+        redis.call('INCR', KEYS[i])
+        redis.call('EXPIRE', KEYS[i], ARGV[2], 'NX')
+    end
+    return {'invalid'}
+end
+local user_key = ARGV[3] .. telegram_id
+if redis.call('GET', user_key) == ARGV[4] then
+    redis.call('DEL', user_key)
+end
+return {'ok', telegram_id}
+""")
+
+
+class LoginCodeThrottled(Exception):
+    pass
+
+
+class LoginCodeUnavailable(Exception):
+    pass
+
+
+def generate_code() -> str:
+    return "".join(secrets.choice("0123456789") for _ in range(settings.login_code_length))
+
+
+async def issue_login_code(telegram_id: str) -> str:
+    for _ in range(settings.login_code_issue_retries):
+        code = generate_code()
+        issued = await ISSUE_SCRIPT(
+            keys=[f"{CODE_PREFIX}{code}", f"{USER_PREFIX}{telegram_id}", f"{CODE_ATTEMPTS_PREFIX}{code}"],
+            args=[str(telegram_id), settings.auth_code_expire, CODE_PREFIX, code],
+        )
+        if issued:
+            return code
+    raise LoginCodeUnavailable("Could not allocate a unique login code")
+
+
+async def redeem_login_code(code: str, client: str | None) -> str | None:
+    result = await REDEEM_SCRIPT(
+        keys=[f"{CODE_PREFIX}{code}", f"{ATTEMPTS_PREFIX}{client or 'unknown'}", f"{CODE_ATTEMPTS_PREFIX}{code}"],
+        args=[
+            settings.login_code_max_attempts,
+            settings.login_code_attempt_window,
+            USER_PREFIX,
+            code,
+            settings.login_code_max_code_attempts,
+        ],
+    )
+    if result[0] == "throttled":
+        raise LoginCodeThrottled()
+    return result[1] if result[0] == "ok" else None
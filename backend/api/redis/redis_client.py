@@ -1,21 +1,61 @@
 import redis.asyncio as redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
 from backend.api.config import settings
+from backend.api.pool_metrics import CheckoutStats
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.checkout_stats = CheckoutStats()
+
+    async def get_connection(self, command_name, *keys, **options):
+        with self.checkout_stats.measure(ConnectionError):
+            return await super().get_connection(command_name, *keys, **options)
+
+    def stats(self) -> dict:
+        return {
+            "max_connections": self.max_connections,
+            "in_use": len(self._in_use_connections),
+            "idle": len(self._available_connections),
+            **self.checkout_stats.as_dict(),
+        }
+
 
 def create_redis_client():
     redis_config = {
         "host": settings.redis_host,
         "port": settings.redis_port,
         "db": settings.redis_db,
-        "decode_responses": True
+        "decode_responses": True,
+        "max_connections": settings.redis_max_connections,
+        "timeout": settings.redis_pool_timeout,
+        "socket_timeout": settings.redis_socket_timeout,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "socket_keepalive": True,
+        "health_check_interval": settings.redis_health_check_interval,
+        "retry_on_timeout": True,
+        "retry_on_error": [ConnectionError, TimeoutError],
+        "retry": Retry(ExponentialBackoff(), settings.redis_retry_attempts),
     }
 
     if settings.redis_ssl:
-        redis_config["ssl"] = True
+        redis_config["connection_class"] = redis.SSLConnection
 
     password = settings.redis_password_value
     if password:
         redis_config["password"] = password
-    
-    return redis.Redis(**redis_config)
+
+    return redis.Redis(connection_pool=InstrumentedConnectionPool(**redis_config))
 
 redis_client = create_redis_client()
+
+
+def redis_pool_stats() -> dict:
+    return redis_client.connection_pool.stats()
+
+
+async def close_redis_client() -> None:
+    await redis_client.aclose(close_connection_pool=True)
@@ -1,8 +1,51 @@
+import logging
+
+from redis.exceptions import RedisError
+
 from backend.api.redis.redis_client import redis_client
 from backend.api.config import settings
 
 
-async def create_login_code(code: str, telegram_id: str) -> str:
-    expire_time = settings.auth_code_expire
-    await redis_client.setex(code, expire_time, str(telegram_id))
-    return code
+logger = logging.getLogger(__name__)
+
+
+def admin_login_attempts_limits(email: str, ip: str | None) -> dict[str, int]:
+    client = ip or "unknown"
+    return {
+        f"admin:login:attempts:{email.lower()}:{client}": settings.admin_login_max_attempts,
+        f"admin:login:attempts:ip:{client}": settings.admin_login_ip_max_attempts,
+    }
+
+
+async def admin_login_throttled(email: str, ip: str | None) -> bool:
+    limits = admin_login_attempts_limits(email, ip)
+    try:
+        attempts = await redis_client.mget(list(limits))
+    except RedisError:
+        logger.warning("Failed to read admin login attempts", exc_info=True)
+        return False
+    return any(count is not None and int(count) >= limit for count, limit in zip(attempts, limits.values()))
+
+
+async def record_failed_admin_login(email: str, ip: str | None) -> None:
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in admin_login_attempts_limits(email, ip):
+                pipe.incr(key)
+                pipe.expire(key, settings.admin_login_window, nx=True)
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Failed to record a failed admin login", exc_info=True)
+
+
+async def reset_failed_admin_logins(email: str, ip: str | None) -> None:
+    key = next(iter(admin_login_attempts_limits(email, ip)))
+    try:
+        await redis_client.delete(key)
+    except RedisError:
+        logger.warning("Failed to reset admin login attempts", exc_info=True)
+
+
+async def acquire_avatar_refresh_lock() -> bool:
+    return bool(await redis_client.set("bot:avatar_refresh", "1", nx=True, ex=settings.avatar_refresh_interval))
+
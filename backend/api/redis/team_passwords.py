@@ -0,0 +1,58 @@
+from backend.api.redis.redis_client import redis_client
+from backend.api.config import settings
+
+
+ATTEMPTS_PREFIX = "teams:attempts:user:"
+TEAM_ATTEMPTS_PREFIX = "teams:attempts:team:"
+
+
+RESERVE_SCRIPT = redis_client.register_script("""
+local user_attempts = tonumber(redis.call('GET', KEYS[1]) or '0')
+local team_attempts = tonumber(redis.call('GET', KEYS[2]) or '0')
+if user_attempts >= tonumber(ARGV[1]) or team_attempts >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[3], 'NX')
+return 1
+""")
+
+FAIL_SCRIPT = redis_client.register_script("""
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1], 'NX')
+""")
+
+REFUND_SCRIPT = redis_client.register_script("""
+if tonumber(redis.call('GET', KEYS[1]) or '0') > 0 then
+    redis.call('DECR', KEYS[1])
+end
+""")
+
+
+class TeamPasswordThrottled(Exception):
+    pass
+
+
+def attempt_keys(team_id: int, telegram_id: str) -> list[str]:
+    return [f"{ATTEMPTS_PREFIX}{telegram_id}", f"{TEAM_ATTEMPTS_PREFIX}{team_id}"]
+
+
+async def reserve_team_password_attempt(team_id: int, telegram_id: str) -> None:
+    reserved = await RESERVE_SCRIPT(
+        keys=attempt_keys(team_id, telegram_id),
+        args=[
+            settings.team_password_max_attempts,
+            settings.team_password_max_team_attempts,
+            settings.team_password_attempt_window,
+        ],
+    )
+    if not reserved:
+        raise TeamPasswordThrottled()
+
+
+async def record_team_password_failure(team_id: int, telegram_id: str) -> None:
+    await FAIL_SCRIPT(keys=attempt_keys(team_id, telegram_id), args=[settings.team_password_attempt_window])
+
+
+async def refund_team_password_attempt(team_id: int, telegram_id: str) -> None:
+    await REFUND_SCRIPT(keys=attempt_keys(team_id, telegram_id))
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, TEXT
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, TEXT
+from sqlalchemy.sql import func
 from backend.api.database import Base
 
 
@@ -14,8 +14,15 @@ class Team(Base):
     description = Column(TEXT, nullable=True)
 
 
-    captain_id = Column(Integer, nullable=False)
-    participants_id = Column(JSONB, nullable=True)
+    captain_id = Column(BigInteger, nullable=False, index=True)
+
+
+class TeamMember(Base):
+    __tablename__ = 'team_members'
+
+    team_id = Column(Integer, ForeignKey('teams.team_id', ondelete='CASCADE'), primary_key=True)
+    telegram_id = Column(TEXT, ForeignKey('users.telegram_id', ondelete='CASCADE'), primary_key=True, index=True)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
 
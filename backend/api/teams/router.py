@@ -1,117 +1,109 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from random import choices
-
-from backend.api.profile.service import get_user_info_by_telegram_id
+import secrets
 
+from backend.api.config import settings
 from backend.api.depends import get_current_telegram_id
 from backend.api.teams.models import Team
-from backend.api.database import get_db
+from backend.api.database import get_db, get_read_db, mark_primary_reads
+from backend.api.pagination import PageParams, page_params, page_response, parse_fields, rows_response
+from backend.api.redis.team_passwords import (
+    TeamPasswordThrottled,
+    record_team_password_failure,
+    refund_team_password_attempt,
+    reserve_team_password_attempt,
+)
 from backend.api.teams.schemas import TeamInfo, EnterTeam, CreateTeam, UpdateTeam, ShortTeamInfo, EnterTeamRequest
-from backend.api.teams.service import all_teams, get_team_by_id, create_team, add_participant
+from backend.api.teams.service import all_teams, get_team_by_id, create_team, add_participant, build_team_info, get_user_teams, count_team_members, short_team_info_row
 
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
 
 def generate_code() -> str:
-    return ''.join(choices('0123456789', k=6))
+    return ''.join(secrets.choice('0123456789') for _ in range(6))
 
 @router.get("", response_model=list[ShortTeamInfo])
 async def all_teams_info(
-    session: AsyncSession = Depends(get_db),
+    fields: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_read_db),
+):
+    selected_fields = parse_fields(fields, ShortTeamInfo)
+    teams, next_cursor = await all_teams(session=session, page=page)
+
+    return page_response([short_team_info_row(team) for team in teams], next_cursor, selected_fields)
+
+@router.get("/my", response_model=list[ShortTeamInfo])
+async def my_teams_info(
+    session: AsyncSession = Depends(get_read_db),
+    telegram_id: str = Depends(get_current_telegram_id)
 ):
-    teams = await all_teams(session=session)
+    teams = await get_user_teams(session=session, telegram_id=telegram_id)
 
-    return [
-        ShortTeamInfo(
-            team_id=team.team_id,
-            title=team.title or "",
-            description=team.description or "",
-        )
-        for team in teams if team
-    ]
+    return rows_response([short_team_info_row(team) for team in teams])
 
 @router.post("/create", response_model=TeamInfo)
-async def create_team(
+async def create_team_endpoint(
+    response: Response,
     session: AsyncSession = Depends(get_db),
     captain_id: str = Depends(get_current_telegram_id)
 ) -> TeamInfo:
     password = str(generate_code())
 
-    team = await create_team(session=session, captain_id=captain_id, password=password)
-    captain = await get_user_info_by_telegram_id(session=session, 
-                                                 telegram_id=str(team.captain_id))
-    participants = [await get_user_info_by_telegram_id(session=session, 
-                                                       telegram_id=str(participant_id)) for participant_id in (team.participants_id or [])]
+    team = await create_team(session=session, captain_id=int(captain_id), password=password)
+    mark_primary_reads(response)
 
-    return TeamInfo(
-        team_id=team.team_id,
-        title=team.title,
-        description=team.description or "",
-        captain=captain,
-        participants=participants
-    )
+    return await build_team_info(session=session, team=team)
 
 @router.post("/{team_id}/enter", response_model=TeamInfo)
 async def enter_team(
     team_id: int,
     request: EnterTeamRequest,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     telegram_id: str = Depends(get_current_telegram_id)
 ) -> TeamInfo:
 
-    team = await get_team_by_id(session=session, team_id=team_id)
+    max_team_size = settings.max_team_size
+    team = await get_team_by_id(session=session, team_id=team_id, for_update=max_team_size is not None)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    if team.password != request.password:
+    try:
+        await reserve_team_password_attempt(team_id=team.team_id, telegram_id=telegram_id)
+    except TeamPasswordThrottled:
+        raise HTTPException(status_code=429, detail="Too many attempts, try again later")
+
+    if not secrets.compare_digest(team.password.encode(), request.password.encode()):
+        await record_team_password_failure(team_id=team.team_id, telegram_id=telegram_id)
         raise HTTPException(status_code=401, detail="Invalid password")
-    
-    participants_list = team.participants_id or []
-    telegram_id_int = int(telegram_id)
-    
-    if telegram_id_int in participants_list:
-        raise HTTPException(status_code=400, detail="User is already a member of this team")
+    await refund_team_password_attempt(team_id=team.team_id, telegram_id=telegram_id)
 
-    if team.captain_id == telegram_id_int:
+    if team.captain_id == int(telegram_id):
         raise HTTPException(status_code=400, detail="Captain cannot join as participant")
-    
-    participants_list.append(telegram_id_int)
-    team = await add_participant(session=session, participants_id=participants_list, team=team)
-    
-    captain = await get_user_info_by_telegram_id(session=session, 
-                                                 telegram_id=str(team.captain_id))
-    participants = [await get_user_info_by_telegram_id(session=session, 
-                                                       telegram_id=str(participant_id)) for participant_id in (team.participants_id or [])]
-    
-    return TeamInfo(
-        team_id=team.team_id,
-        title=team.title,
-        description=team.description or "",
-        captain=captain,
-        participants=participants
-    )
+
+    if max_team_size is not None:
+        members_count = await count_team_members(session=session, team_id=team.team_id)
+        if members_count + 1 >= max_team_size:
+            raise HTTPException(status_code=409, detail="Team is full")
+
+    if not await add_participant(session=session, team=team, telegram_id=telegram_id):
+        raise HTTPException(status_code=400, detail="User is already a member of this team")
+    mark_primary_reads(response)
+
+    return await build_team_info(session=session, team=team)
 
 
 
 @router.get("/{team_id}", response_model=TeamInfo)
 async def hack_info(
     team_id: int,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_read_db),
 ) -> TeamInfo:
     team = await get_team_by_id(session=session, team_id=team_id)
 
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    
-    captain = await get_user_info_by_telegram_id(session=session, telegram_id=str(team.captain_id))
-    participants = [await get_user_info_by_telegram_id(session=session, telegram_id=str(participant_id)) for participant_id in (team.participants_id or [])]
-
-    return TeamInfo(
-        team_id=team.team_id,
-        title=team.title,
-        description=team.description or "",
-        captain=captain,
-        participants=participants
-    )
\ No newline at end of file
+
+    return await build_team_info(session=session, team=team)
\ No newline at end of file
@@ -11,7 +11,7 @@ class TeamInfo(BaseModel):
     team_id: int
     title: str
     description: str
-    captain: UserInfo
+    captain: UserInfo | None
     participants: list[UserInfo]
 
 class CreateTeam(BaseModel):
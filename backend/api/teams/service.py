@@ -1,41 +1,109 @@
-from backend.api.teams.models import Team
+from backend.api.teams.models import Team, TeamMember
+from backend.api.teams.schemas import TeamInfo
+from backend.api.profile.service import get_users_by_telegram_ids
+from backend.api.profile.utils import build_user_info
+from backend.api.pagination import PageParams, paginate, split_page
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Row, func, null, select, union_all
+from sqlalchemy.dialects.postgresql import insert
 
 
-async def get_team_by_id(session: AsyncSession, team_id: int) -> Team | None:
-    result = await session.execute(
-        select(Team).where(Team.team_id == team_id)
-    )
+async def get_team_by_id(session: AsyncSession, team_id: int, for_update: bool = False) -> Team | None:
+    query = select(Team).where(Team.team_id == team_id)
+    if for_update:
+        query = query.with_for_update()
+
+    result = await session.execute(query)
     team = result.scalars().first()
     return team
 
-async def all_teams(session: AsyncSession) -> list[Team]:
-    result = await session.execute(select(Team))
+SHORT_TEAM_FIELDS = (Team.team_id, Team.title, Team.description)
+
+async def all_teams(session: AsyncSession, page: PageParams) -> tuple[list[Row], int | None]:
+    query = select(*SHORT_TEAM_FIELDS)
+
+    result = await session.execute(paginate(query, Team.team_id, page))
+    return split_page(result.all(), page, key=lambda team: team.team_id)
+
+async def get_user_teams(session: AsyncSession, telegram_id: str) -> list[Row]:
+    captained = (
+        select(*SHORT_TEAM_FIELDS, null().label("joined_at"))
+        .where(Team.captain_id == int(telegram_id))
+    )
+    joined = (
+        select(*SHORT_TEAM_FIELDS, TeamMember.joined_at)
+        .join(TeamMember, TeamMember.team_id == Team.team_id)
+        .where(TeamMember.telegram_id == telegram_id)
+    )
+    teams = union_all(captained, joined).subquery()
+
+    result = await session.execute(
+        select(teams.c.team_id, teams.c.title, teams.c.description)
+        .order_by(teams.c.joined_at.nulls_first(), teams.c.team_id)
+    )
+    return result.all()
+
+async def get_team_member_ids(session: AsyncSession, team_id: int) -> list[str]:
+    result = await session.execute(
+        select(TeamMember.telegram_id)
+        .where(TeamMember.team_id == team_id)
+        .order_by(TeamMember.joined_at)
+    )
     return result.scalars().all()
 
-async def create_team(session: AsyncSession, description: str, title: str, captaind_id: int, password: str) -> Team:
+async def count_team_members(session: AsyncSession, team_id: int) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(TeamMember).where(TeamMember.team_id == team_id)
+    )
+    return result.scalar_one()
+
+async def create_team(session: AsyncSession, captain_id: int, password: str, title: str | None = None, description: str | None = None) -> Team:
     
     new_team = Team(
         title=title,
         description=description,
         password=password,
-        captaind_id=captaind_id,
-        participants_id=None
+        captain_id=captain_id,
     )
 
     session.add(new_team)
     await session.commit()
-    await session.refresh(new_team)
 
     return new_team
 
-async def add_participant(session: AsyncSession, participants_id: list[int], team: Team):
-    team.participants_id = participants_id
+async def add_participant(session: AsyncSession, team: Team, telegram_id: str) -> bool:
+    result = await session.execute(
+        insert(TeamMember)
+        .values(team_id=team.team_id, telegram_id=telegram_id)
+        .on_conflict_do_nothing()
+        .returning(TeamMember.team_id)
+    )
+    added = result.scalar() is not None
     await session.commit()
-    await session.refresh(team)
 
-    return team
+    return added
+
+def short_team_info_row(team: Team | Row) -> dict:
+    return {
+        "team_id": team.team_id,
+        "title": team.title or "",
+        "description": team.description or "",
+    }
+
+async def build_team_info(session: AsyncSession, team: Team) -> TeamInfo:
+    captain_id = str(team.captain_id)
+    participant_ids = await get_team_member_ids(session=session, team_id=team.team_id)
+
+    users = await get_users_by_telegram_ids(session=session, telegram_ids=[captain_id, *participant_ids])
+    captain = next((user for user in users if user.telegram_id == captain_id), None)
+
+    return TeamInfo(
+        team_id=team.team_id,
+        title=team.title or "",
+        description=team.description or "",
+        captain=build_user_info(captain) if captain else None,
+        participants=[build_user_info(user) for user in users if user.telegram_id != captain_id],
+    )
 
 async def delete_hack(session: AsyncSession, team: Team) -> None:
     await session.delete(team)
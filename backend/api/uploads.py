@@ -0,0 +1,112 @@
+import asyncio
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import Request
+from python_multipart import MultipartParser
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import parse_options_header
+
+from backend.api.config import settings
+from backend.api.images import ImageTooLarge, InvalidImage
+
+
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadReceiver:
+    def __init__(self, field: str, max_size: int):
+        self.field = field.encode()
+        self.max_size = max_size
+        self.size = 0
+        self.found = False
+        self.in_field = False
+        self.header_name = b""
+        self.header_value = b""
+        self.disposition = b""
+        self.pending: list[bytes] = []
+
+    def on_part_begin(self) -> None:
+        self.disposition = b""
+        self.in_field = False
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self.header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self.header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        if self.header_name.lower() == b"content-disposition":
+            self.disposition = self.header_value
+        self.header_name = b""
+        self.header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self.disposition)
+        self.in_field = not self.found and options.get(b"name") == self.field and b"filename" in options
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if not self.in_field:
+            return
+        self.size += end - start
+        if self.size > self.max_size:
+            raise ImageTooLarge(f"Image is larger than {self.max_size} bytes")
+        self.pending.append(data[start:end])
+
+    def on_part_end(self) -> None:
+        if self.in_field:
+            self.found = True
+            self.in_field = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+        }
+
+
+@asynccontextmanager
+async def receive_upload(request: Request, field: str, max_size: int | None = None) -> AsyncIterator[str]:
+    max_size = settings.max_image_size if max_size is None else max_size
+    max_body_size = max_size + MULTIPART_OVERHEAD
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_body_size:
+        raise ImageTooLarge(f"Image is larger than {max_size} bytes")
+
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        raise InvalidImage("Expected a multipart/form-data upload")
+
+    with tempfile.TemporaryDirectory(prefix="upload-") as directory:
+        path = os.path.join(directory, "upload")
+        receiver = UploadReceiver(field, max_size)
+        parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+
+        try:
+            with open(path, "wb") as upload_file:
+                received = 0
+                async for chunk in request.stream():
+                    received += len(chunk)
+                    if received > max_body_size:
+                        raise ImageTooLarge(f"Image is larger than {max_size} bytes")
+                    parser.write(chunk)
+                    if receiver.pending:
+                        await asyncio.to_thread(upload_file.writelines, receiver.pending)
+                        receiver.pending.clear()
+                parser.finalize()
+        except FormParserError as e:
+            raise InvalidImage("Malformed multipart upload") from e
+
+        if not receiver.found:
+            raise InvalidImage(f"Missing file field '{field}'")
+
+        yield path
@@ -0,0 +1,105 @@
+import os
+import socket
+import threading
+
+from fakeredis import TcpFakeServer
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+redis_port = free_port()
+redis_server = TcpFakeServer(("127.0.0.1", redis_port), server_type="redis")
+threading.Thread(target=redis_server.serve_forever, daemon=True).start()
+
+os.environ["REDIS_HOST"] = "127.0.0.1"
+os.environ["REDIS_PORT"] = str(redis_port)
+os.environ["REDIS_PASSWORD"] = ""
+os.environ["REDIS_DB"] = "0"
+os.environ["REDIS_SSL"] = "false"
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("BOT_TOKEN", "1:test")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL", "postgresql+asyncpg://test@127.0.0.1:1/test")
+os.environ["DATABASE_REPLICA_URL"] = os.environ.get("TEST_DATABASE_REPLICA_URL", "")
+
+
+import httpx
+import jwt
+import pytest
+from alembic import command
+from sqlalchemy import text
+
+from backend.api import migrate
+from backend.api.config import settings
+from backend.api.database import READ_PRIMARY_COOKIE, engine, replica_engine
+from backend.api.main import app
+from backend.api.redis.redis_client import redis_client
+
+
+requires_postgres = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="TEST_DATABASE_URL is not set",
+)
+
+requires_replica = pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL") or not os.environ.get("TEST_DATABASE_REPLICA_URL"),
+    reason="TEST_DATABASE_URL and TEST_DATABASE_REPLICA_URL are not set",
+)
+
+def access_token(telegram_id: str) -> str:
+    return jwt.encode({"telegram_id": telegram_id}, settings.secret_key, algorithm=settings.algorithm)
+
+
+TABLES = "users, hackathons, teams, team_members, blobs, admins"
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def connections():
+    yield
+    await redis_client.aclose(close_connection_pool=True)
+    await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+@pytest.fixture
+async def redis():
+    await redis_client.flushdb()
+    yield redis_client
+
+
+async def reset_schema(db_engine) -> None:
+    async with db_engine.begin() as conn:
+        await conn.run_sync(migrate.run_command, command.upgrade, "head")
+        await conn.execute(text(f"TRUNCATE {TABLES} RESTART IDENTITY CASCADE"))
+
+
+@pytest.fixture
+async def database():
+    await reset_schema(engine)
+    if replica_engine is not None:
+        await reset_schema(replica_engine)
+    yield engine
+
+
+@pytest.fixture
+async def api_client(redis):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        cookies={READ_PRIMARY_COOKIE: "1"},
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+async def client(database, api_client):
+    yield api_client
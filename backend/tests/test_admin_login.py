@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from backend.api.admin import utils as admin_utils
+from backend.api.admin.models import Admin
+from backend.api.admin.utils import hash_password
+from backend.api.config import settings
+from backend.api.database import async_session
+from backend.api.redis.redis_client import redis_client
+from backend.tests.conftest import requires_postgres
+
+
+pytestmark = [pytest.mark.anyio, requires_postgres]
+
+EMAIL = "admin@example.com"
+PASSWORD = "correct horse"
+
+
+@pytest.fixture
+async def admin(database):
+    async with async_session() as session:
+        session.add(Admin(email=EMAIL, password_hash=hash_password(PASSWORD)))
+        await session.commit()
+
+
+async def login(client, password: str, ip: str) -> int:
+    response = await client.post(
+        "/api/admin/login",
+        json={"email": EMAIL, "password": password},
+        headers={"X-Real-IP": ip},
+    )
+    return response.status_code
+
+
+async def test_failed_logins_lock_out_only_the_offending_client(client, admin):
+    for _ in range(settings.admin_login_max_attempts):
+        assert await login(client, "wrong", ip="203.0.113.1") == 401
+
+    assert await login(client, PASSWORD, ip="203.0.113.1") == 429
+    assert await login(client, "wrong", ip="203.0.113.2") == 401
+    assert await login(client, PASSWORD, ip="203.0.113.2") == 200
+
+
+async def test_forged_real_ip_from_untrusted_peer_is_ignored(client, admin, monkeypatch):
+    monkeypatch.setattr("backend.api.depends.trusted_proxies", [])
+
+    for i in range(settings.admin_login_max_attempts):
+        assert await login(client, "wrong", ip=f"203.0.113.{i}") == 401
+
+    assert await login(client, PASSWORD, ip="203.0.113.200") == 429
+
+
+async def test_login_fails_open_when_redis_is_down(client, admin, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise ConnectionError("redis is down")
+
+    monkeypatch.setattr(redis_client.connection_pool, "get_connection", unavailable)
+
+    assert await login(client, "wrong", ip="203.0.113.1") == 401
+    assert await login(client, PASSWORD, ip="203.0.113.1") == 200
+
+
+async def test_login_is_rejected_when_password_queue_is_full(client, admin, monkeypatch):
+    monkeypatch.setattr(admin_utils, "password_slots", asyncio.Semaphore(0))
+
+    assert await login(client, PASSWORD, ip="203.0.113.1") == 429
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from backend.api.bot.avatars import AvatarSync
+from backend.api.config import settings
+from backend.api.images import ImageTooLarge
+
+
+pytestmark = pytest.mark.anyio
+
+CHUNK = b"x" * 512
+
+
+async def stream_without_length(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse()
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    for _ in range(int(request.query["chunks"])):
+        await response.write(CHUNK)
+    await response.write_eof()
+    return response
+
+
+@pytest.fixture
+async def avatar_sync():
+    app = web.Application()
+    app.router.add_get("/file", stream_without_length)
+
+    async with TestServer(app) as server:
+        async def get_file(file_id: str):
+            return SimpleNamespace(file_path=file_id)
+
+        bot = SimpleNamespace(
+            token="token",
+            get_file=get_file,
+            session=SimpleNamespace(api=SimpleNamespace(file_url=lambda token, path: str(server.make_url(f"/file?chunks={path}")))),
+        )
+        sync = AvatarSync(bot)
+        async with aiohttp.ClientSession() as http:
+            sync.http = http
+            yield sync
+
+
+def photo(chunks: int) -> SimpleNamespace:
+    return SimpleNamespace(file_id=str(chunks), file_size=None)
+
+
+async def test_download_without_content_length_is_capped(avatar_sync, monkeypatch):
+    monkeypatch.setattr(settings, "max_image_size", len(CHUNK) * 4)
+
+    with pytest.raises(ImageTooLarge):
+        await avatar_sync.download(photo(chunks=16))
+
+
+async def test_download_within_limit(avatar_sync, monkeypatch):
+    monkeypatch.setattr(settings, "max_image_size", len(CHUNK) * 4)
+
+    assert await avatar_sync.download(photo(chunks=4)) == CHUNK * 4
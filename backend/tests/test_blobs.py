@@ -0,0 +1,64 @@
+import hashlib
+
+import pytest
+from sqlalchemy import text
+
+from backend.api.blobs.models import Blob
+from backend.api.blobs.storage import blob_store
+from backend.api.database import async_session, engine
+from backend.api.migrate import move_images_to_blob_store
+from backend.api.models import User
+from backend.tests.conftest import requires_postgres
+
+
+pytestmark = [pytest.mark.anyio, requires_postgres]
+
+DATA = b"\xff\xd8 not really a jpeg"
+BLOB_HASH = hashlib.sha256(DATA).hexdigest()
+
+
+@pytest.fixture
+async def avatar(database, tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    async with async_session() as session:
+        session.add(Blob(hash=BLOB_HASH, content_type="image/jpeg", size=len(DATA)))
+        await session.flush()
+        session.add(User(telegram_id="1", avatar_hash=BLOB_HASH))
+        await session.commit()
+
+
+async def test_avatar_is_served_from_local_store(client, avatar):
+    await blob_store.put(BLOB_HASH, DATA)
+
+    response = await client.get("/api/participants/1/avatar")
+
+    assert response.status_code == 200
+    assert response.content == DATA
+    assert response.headers["etag"] == f'"{BLOB_HASH}"'
+
+
+async def test_missing_blob_file_is_not_found(client, avatar):
+    response = await client.get("/api/participants/1/avatar")
+
+    assert response.status_code == 404
+
+
+async def test_legacy_image_without_renditions_is_kept(database, tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        await conn.execute(text(
+            "ALTER TABLE hackathons ADD COLUMN pic BYTEA, ADD COLUMN pic_thumb BYTEA, ADD COLUMN pic_medium BYTEA"
+        ))
+        await conn.execute(
+            text("INSERT INTO hackathons (title, event_date, pic) VALUES ('Too large', '2026-01-01', :pic)"),
+            {"pic": DATA},
+        )
+
+        await move_images_to_blob_store(conn)
+
+        row = (await conn.execute(text("SELECT pic_hash, pic_thumb_hash, pic_medium_hash FROM hackathons"))).one()
+        await transaction.rollback()
+
+    assert tuple(row) == (BLOB_HASH, None, None)
+    assert await blob_store.get(BLOB_HASH) == DATA
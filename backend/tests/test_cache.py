@@ -0,0 +1,40 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from backend.api.redis.cache import cache_stats, cached_response
+from backend.tests.conftest import requires_postgres
+
+
+pytestmark = [pytest.mark.anyio, requires_postgres]
+
+
+async def test_coalesced_load_survives_cancelled_first_waiter(database, redis):
+    started = asyncio.Event()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load(session) -> JSONResponse:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await release.wait()
+        result = await session.execute(text("SELECT 1"))
+        return JSONResponse({"value": result.scalar()})
+
+    first = asyncio.create_task(cached_response("test:coalesced", load))
+    await started.wait()
+    second = asyncio.create_task(cached_response("test:coalesced", load))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+    response = await second
+
+    assert json.loads(response.body) == {"value": 1}
+    assert calls == 1
+    assert cache_stats["coalesced"] >= 1
+    assert (await cached_response("test:coalesced", load)).body == response.body
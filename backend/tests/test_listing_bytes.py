@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+from sqlalchemy import event
+
+from backend.api.blobs.models import Blob
+from backend.api.database import async_session, engine
+from backend.api.hackathons.models import Hackathon
+from backend.api.models import User
+from backend.api.teams.models import Team
+from backend.tests.conftest import requires_postgres
+
+
+pytestmark = [pytest.mark.anyio, requires_postgres]
+
+ROWS = 50
+DESCRIPTION = "x" * 200
+ROW_BUDGET = len(DESCRIPTION) + 160
+
+
+class StatementRecorder:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, tuple(parameters or ())))
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(engine.sync_engine, "before_cursor_execute", self)
+
+
+async def transferred_bytes(statements) -> int:
+    total = 0
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        for statement, parameters in statements:
+            total += await raw.driver_connection.fetchval(
+                f"SELECT coalesce(sum(pg_column_size(t.*)), 0) FROM ({statement}) AS t",
+                *parameters,
+            )
+    return total
+
+
+@pytest.fixture
+async def seeded(database):
+    async with async_session() as session:
+        session.add(Blob(hash="a" * 64, content_type="image/jpeg", size=5 * 1024 * 1024))
+        await session.flush()
+        for i in range(ROWS):
+            session.add(User(
+                telegram_id=str(1000 + i),
+                fullname=f"User {i}",
+                description=DESCRIPTION,
+                role="participant",
+                tags=["python"],
+                avatar_hash="a" * 64,
+                avatar_thumb_hash="a" * 64,
+                avatar_medium_hash="a" * 64,
+            ))
+            session.add(Hackathon(
+                title=f"Hack {i}",
+                description=DESCRIPTION,
+                event_date=datetime.date(2026, 1, 1),
+                pic_hash="a" * 64,
+                pic_thumb_hash="a" * 64,
+                pic_medium_hash="a" * 64,
+            ))
+            session.add(Team(title=f"Team {i}", description=DESCRIPTION, password="123456", captain_id=1000 + i))
+        await session.commit()
+
+
+@pytest.mark.parametrize("path", ["/api/participants", "/api/hackathons", "/api/teams"])
+async def test_listing_transfers_only_listed_columns(client, seeded, path):
+    with StatementRecorder() as recorder:
+        response = await client.get(path, params={"limit": ROWS})
+
+    assert response.status_code == 200
+    assert len(response.json()) == ROWS
+
+    assert recorder.statements
+    assert await transferred_bytes(recorder.statements) <= ROWS * ROW_BUDGET
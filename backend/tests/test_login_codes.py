@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from backend.api.config import settings
+from backend.api.redis import login_codes
+from backend.api.redis.login_codes import LoginCodeThrottled, issue_login_code, redeem_login_code
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_issues_never_share_a_code(redis):
+    telegram_ids = [str(1000 + i) for i in range(500)]
+
+    codes = await asyncio.gather(*(issue_login_code(telegram_id) for telegram_id in telegram_ids))
+
+    assert len(set(codes)) == len(codes)
+    redeemed = await asyncio.gather(*(redeem_login_code(code, client=f"10.0.{i // 256}.{i % 256}") for i, code in enumerate(codes)))
+    assert redeemed == telegram_ids
+
+
+async def test_concurrent_redemptions_of_one_code_succeed_once(redis):
+    code = await issue_login_code("1")
+
+    results = await asyncio.gather(
+        *(redeem_login_code(code, client=f"10.0.0.{i}") for i in range(100)),
+        return_exceptions=True,
+    )
+
+    assert results.count("1") == 1
+    assert all(result is None or isinstance(result, LoginCodeThrottled) for result in results if result != "1")
+
+
+async def test_reissue_invalidates_previous_code(redis):
+    first = await issue_login_code("1")
+    second = await issue_login_code("1")
+
+    assert await redeem_login_code(first, client="10.0.0.1") is None
+    assert await redeem_login_code(second, client="10.0.0.1") == "1"
+
+
+async def test_client_throttle_is_per_client(redis):
+    code = await issue_login_code("1")
+    for i in range(settings.login_code_max_attempts):
+        await redeem_login_code(f"x{i}", client="10.0.0.1")
+
+    with pytest.raises(LoginCodeThrottled):
+        await redeem_login_code(code, client="10.0.0.1")
+    assert await redeem_login_code(code, client="10.0.0.2") == "1"
+
+
+async def test_code_throttle_spans_clients_and_blocks_reissue(redis, monkeypatch):
+    for i in range(settings.login_code_max_code_attempts):
+        assert await redeem_login_code("123456", client=f"10.0.0.{i}") is None
+
+    with pytest.raises(LoginCodeThrottled):
+        await redeem_login_code("123456", client="10.0.1.1")
+
+    candidates = iter(["123456", "654321"])
+    monkeypatch.setattr(login_codes, "generate_code", lambda: next(candidates))
+    assert await issue_login_code("1") == "654321"
+
+
+async def test_login_endpoint_throttles_by_forwarded_client(api_client):
+    client = api_client
+    code = await issue_login_code("1")
+    for i in range(settings.login_code_max_attempts):
+        response = await client.post("/login-by-code", json={"code": f"x{i}"}, headers={"X-Real-IP": "203.0.113.1"})
+        assert response.status_code == 400
+
+    response = await client.post("/login-by-code", json={"code": code}, headers={"X-Real-IP": "203.0.113.1"})
+    assert response.status_code == 429
+
+    response = await client.post("/login-by-code", json={"code": code}, headers={"X-Real-IP": "203.0.113.2"})
+    assert response.status_code == 200
+    assert "access_token" in response.cookies
@@ -0,0 +1,98 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.api.database import READ_PRIMARY_COOKIE, async_replica_session, async_session, create_engine
+from backend.api.models import User
+from backend.tests.conftest import access_token, requires_replica
+
+
+pytestmark = [pytest.mark.anyio, requires_replica]
+
+
+async def add_user(sessionmaker, fullname: str) -> None:
+    async with sessionmaker() as session:
+        session.add(User(telegram_id="1", fullname=fullname))
+        await session.commit()
+
+
+@pytest.fixture
+async def replica_client(database, api_client, monkeypatch):
+    monkeypatch.setattr("backend.api.database.replica_unhealthy_until", 0.0)
+    await add_user(async_session, "Primary")
+    await add_user(async_replica_session, "Replica")
+    api_client.cookies.clear()
+    yield api_client
+
+
+async def listed_fullname(client) -> str:
+    response = await client.get("/api/participants")
+    assert response.status_code == 200
+    return response.json()[0]["fullname"]
+
+
+async def test_reads_go_to_the_replica(replica_client):
+    assert await listed_fullname(replica_client) == "Replica"
+
+
+async def test_own_write_pins_reads_to_the_primary(replica_client):
+    response = await replica_client.post(
+        "/api/participants/1",
+        json={"fullname": "Updated"},
+        cookies={"access_token": access_token("1")},
+    )
+
+    assert response.status_code == 200
+    assert READ_PRIMARY_COOKIE in response.cookies
+    assert await listed_fullname(replica_client) == "Updated"
+
+    replica_client.cookies.delete(READ_PRIMARY_COOKIE)
+    assert await listed_fullname(replica_client) == "Replica"
+
+
+async def test_unhealthy_replica_falls_back_to_the_primary(replica_client, monkeypatch):
+    broken_engine = create_engine("postgresql+asyncpg://postgres@127.0.0.1:1/test")
+    broken_sessions = async_sessionmaker(bind=broken_engine, class_=AsyncSession)
+    attempts = 0
+
+    def open_broken_session():
+        nonlocal attempts
+        attempts += 1
+        return broken_sessions()
+
+    monkeypatch.setattr("backend.api.database.async_replica_session", open_broken_session)
+    try:
+        assert await listed_fullname(replica_client) == "Primary"
+        assert await listed_fullname(replica_client) == "Primary"
+        assert attempts == 1
+    finally:
+        await broken_engine.dispose()
+
+    monkeypatch.setattr("backend.api.database.async_replica_session", async_replica_session)
+    monkeypatch.setattr("backend.api.database.replica_unhealthy_until", 0.0)
+    assert await listed_fullname(replica_client) == "Replica"
+
+
+async def profile_fullname(client, **kwargs) -> str:
+    response = await client.get("/api/participants/1", **kwargs)
+    assert response.status_code == 200
+    return response.json()["fullname"]
+
+
+async def test_own_write_skips_stale_cached_profile(replica_client, redis):
+    response = await replica_client.post(
+        "/api/participants/1",
+        json={"fullname": "Updated"},
+        cookies={"access_token": access_token("1")},
+    )
+    assert READ_PRIMARY_COOKIE in response.cookies
+    pinned_cookie = replica_client.cookies[READ_PRIMARY_COOKIE]
+
+    replica_client.cookies.delete(READ_PRIMARY_COOKIE)
+    assert await profile_fullname(replica_client) == "Replica"
+    assert await profile_fullname(replica_client) == "Replica"
+
+    replica_client.cookies.set(READ_PRIMARY_COOKIE, pinned_cookie)
+    assert await profile_fullname(replica_client) == "Updated"
+
+    replica_client.cookies.delete(READ_PRIMARY_COOKIE)
+    assert await profile_fullname(replica_client) == "Updated"
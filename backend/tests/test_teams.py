@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from backend.api.config import settings
+from backend.api.database import async_session
+from backend.api.models import User
+from backend.api.teams.models import Team, TeamMember
+from backend.tests.conftest import access_token, requires_postgres
+
+
+pytestmark = [pytest.mark.anyio, requires_postgres]
+
+JOINERS = 300
+
+
+async def create_team(captain_id: int, members: list[str] = (), password: str = "123456") -> int:
+    async with async_session() as session:
+        team = Team(title="Team", description="", password=password, captain_id=captain_id)
+        session.add(team)
+        await session.flush()
+        session.add_all(TeamMember(team_id=team.team_id, telegram_id=member) for member in members)
+        await session.commit()
+        return team.team_id
+
+
+async def create_users(*telegram_ids: str) -> None:
+    async with async_session() as session:
+        session.add_all(User(telegram_id=telegram_id, fullname=f"User {telegram_id}") for telegram_id in telegram_ids)
+        await session.commit()
+
+
+async def test_team_without_captain_row(client):
+    await create_users("2")
+    team_id = await create_team(captain_id=1, members=["2"])
+
+    response = await client.get(f"/api/teams/{team_id}")
+
+    assert response.status_code == 200
+    assert response.json()["captain"] is None
+    assert [user["telegram_id"] for user in response.json()["participants"]] == ["2"]
+
+
+async def test_my_teams_include_captained_teams(client):
+    await create_users("1", "2")
+    captained = await create_team(captain_id=1)
+    joined = await create_team(captain_id=2, members=["1"])
+    await create_team(captain_id=2)
+
+    client.cookies.set("access_token", access_token("1"))
+    response = await client.get("/api/teams/my")
+
+    assert response.status_code == 200
+    assert [team["team_id"] for team in response.json()] == [captained, joined]
+
+
+async def test_captain_with_large_telegram_id(client):
+    telegram_id = str(2**31 + 7)
+    await create_users(telegram_id)
+    client.cookies.set("access_token", access_token(telegram_id))
+
+    created = await client.post("/api/teams/create")
+    assert created.status_code == 200
+    assert created.json()["captain"]["telegram_id"] == telegram_id
+
+    response = await client.get("/api/teams/my")
+
+    assert response.status_code == 200
+    assert [team["team_id"] for team in response.json()] == [created.json()["team_id"]]
+
+
+async def join_concurrently(client, team_id: int, telegram_ids: list[str]) -> list[int]:
+    async def join(telegram_id: str) -> int:
+        response = await client.post(
+            f"/api/teams/{team_id}/enter",
+            json={"password": "123456"},
+            cookies={"access_token": access_token(telegram_id)},
+        )
+        return response.status_code
+
+    return await asyncio.gather(*(join(telegram_id) for telegram_id in telegram_ids))
+
+
+async def member_ids(team_id: int) -> set[str]:
+    async with async_session() as session:
+        result = await session.execute(select(TeamMember.telegram_id).where(TeamMember.team_id == team_id))
+        return set(result.scalars().all())
+
+
+async def test_concurrent_joins_keep_every_membership(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_team_size", None)
+    joiners = [str(100 + i) for i in range(JOINERS)]
+    await create_users("1", *joiners)
+    team_id = await create_team(captain_id=1)
+
+    statuses = await join_concurrently(client, team_id, joiners + joiners[:JOINERS // 10])
+
+    assert statuses.count(200) == JOINERS
+    assert statuses.count(400) == JOINERS // 10
+    assert await member_ids(team_id) == set(joiners)
+
+
+async def test_concurrent_joins_respect_max_team_size(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_team_size", 11)
+    joiners = [str(100 + i) for i in range(JOINERS)]
+    await create_users("1", *joiners)
+    team_id = await create_team(captain_id=1)
+
+    statuses = await join_concurrently(client, team_id, joiners)
+
+    assert statuses.count(200) == 10
+    assert statuses.count(409) == JOINERS - 10
+    assert len(await member_ids(team_id)) == 10
+
+
+async def enter_team(client, team_id: int, telegram_id: str, password: str) -> int:
+    response = await client.post(
+        f"/api/teams/{team_id}/enter",
+        json={"password": password},
+        cookies={"access_token": access_token(telegram_id)},
+    )
+    return response.status_code
+
+
+async def test_wrong_team_passwords_are_throttled_per_user(client, monkeypatch):
+    monkeypatch.setattr(settings, "team_password_max_attempts", 3)
+    await create_users("1", "2")
+    team_id = await create_team(captain_id=1)
+    other_team_id = await create_team(captain_id=1)
+
+    statuses = await asyncio.gather(*(enter_team(client, team_id, "2", f"{i:06d}") for i in range(10)))
+
+    assert statuses.count(401) == 3
+    assert statuses.count(429) == 7
+    assert await enter_team(client, other_team_id, "2", "123456") == 429
+    assert await member_ids(other_team_id) == set()
+
+
+async def test_wrong_team_passwords_are_throttled_per_team(client, monkeypatch):
+    monkeypatch.setattr(settings, "team_password_max_team_attempts", 3)
+    guessers = [str(100 + i) for i in range(5)]
+    await create_users("1", "2", *guessers)
+    team_id = await create_team(captain_id=1)
+    other_team_id = await create_team(captain_id=1)
+
+    statuses = [await enter_team(client, team_id, guesser, "000000") for guesser in guessers]
+
+    assert statuses == [401, 401, 401, 429, 429]
+    assert await enter_team(client, team_id, "2", "123456") == 429
+    assert await enter_team(client, other_team_id, "2", "123456") == 200